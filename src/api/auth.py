@@ -21,9 +21,13 @@ from core.errors import (
     ConflictError,
     ValidationError
 )
+from scraper.storage_state import delete_storage_state
+from utils.logger import setup_logger
 
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
 
+logger = setup_logger("auth")
+
 
 # ===== Request/Response Models =====
 
@@ -210,6 +214,18 @@ async def save_dfb_credentials(
     if not request.dfb_username or not request.dfb_password:
         raise ValidationError("DFB Username und Passwort müssen angegeben werden")
 
+    # Gespeicherten DFBnet-Login der alten Credentials verwerfen
+    # (darf das Speichern der neuen Credentials nicht verhindern)
+    old_creds = get_dfb_credentials(user_id)
+    if old_creds:
+        try:
+            delete_storage_state(
+                decrypt_credential(old_creds['dfb_username_encrypted']),
+                decrypt_credential(old_creds['dfb_password_encrypted'])
+            )
+        except Exception as e:
+            logger.warning(f"[User {user_id}] Alter DFBnet-Login konnte nicht verworfen werden: {e}")
+
     # Verschluesseln
     encrypted_username = encrypt_credential(request.dfb_username)
     encrypted_password = encrypt_credential(request.dfb_password)
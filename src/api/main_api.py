@@ -716,13 +716,14 @@ async def download_all_as_zip(
     logger.info(f"Session-Pfad: {session_path}")
     logger.info(f"Existiert: {session_path.exists()}")
 
-    # Liste Dateien auf
+    # Liste Dateien auf und finde DOCX-Dateien - ein Verzeichnis-Durchlauf
+    docx_files = []
     if session_path.exists():
-        all_files = list(session_path.iterdir())
+        with os.scandir(session_path) as entries:
+            all_files = list(entries)
         logger.info(f"Dateien im Ordner: {[f.name for f in all_files]}")
+        docx_files = [f for f in all_files if f.name.endswith(".docx")]
 
-    # Finde DOCX-Dateien
-    docx_files = list(session_path.glob("*.docx"))
     logger.info(f"Gefundene DOCX-Dateien: {len(docx_files)}")
 
     if not docx_files:
@@ -753,7 +754,7 @@ async def download_all_as_zip(
     try:
         with zipfile.ZipFile(str(zip_path), 'w', zipfile.ZIP_DEFLATED) as zipf:
             for docx in docx_files:
-                zipf.write(str(docx), docx.name)
+                zipf.write(docx.path, docx.name)
                 logger.info(f"  Added: {docx.name}")
 
         if not zip_path.exists():
@@ -898,7 +899,10 @@ async def debug_session(session_id: str, current_user: dict = Depends(get_curren
         })
 
     # Alle Dateien auflisten
-    all_files = [f.name for f in session_path.iterdir()] if session_path.exists() else []
+    all_files = []
+    if session_path.exists():
+        with os.scandir(session_path) as entries:
+            all_files = [entry.name for entry in entries]
 
     # Metadata laden
     metadata = {}
@@ -908,7 +912,7 @@ async def debug_session(session_id: str, current_user: dict = Depends(get_curren
             metadata = json.load(f)
 
     # DOCX-Dateien
-    docx_files = [f.name for f in session_path.glob("*.docx")]
+    docx_files = [name for name in all_files if name.endswith(".docx")]
 
     return JSONResponse({
         "session_id": session_id,
@@ -933,6 +937,18 @@ async def health_check():
     }
 
 
+def _count_generated_documents(base_dir: str) -> int:
+    """Zaehlt die DOCX-Dateien in allen Session-Ordnern (os.scandir statt glob)"""
+    count = 0
+    with os.scandir(base_dir) as sessions:
+        for session in sessions:
+            if not session.is_dir():
+                continue
+            with os.scandir(session.path) as entries:
+                count += sum(1 for entry in entries if entry.name.endswith(".docx"))
+    return count
+
+
 @app.get("/api/stats/public")
 async def get_public_stats():
     """
@@ -940,7 +956,7 @@ async def get_public_stats():
     Zaehlt live die generierten DOCX-Dokumente im Output-Verzeichnis.
     """
     try:
-        count = sum(1 for _ in session_manager.base_output_dir.glob("*/*.docx"))
+        count = _count_generated_documents(str(session_manager.base_output_dir))
     except Exception as e:
         logger.error(f"Fehler beim Zaehlen der Dokumente: {e}")
         count = 0
@@ -7,7 +7,7 @@ from docx import Document
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 from utils.logger import setup_logger
-from utils.match_utils import parse_anpfiff, generate_filename_from_match, sanitize_team_name, extract_iso_date_from_anpfiff
+from utils.match_utils import parse_anpfiff_full, generate_filename_from_match, sanitize_team_name
 from generator.spesen_calculator import calculate_spesen, format_spesen
 
 logger = setup_logger("docx_generator")
@@ -320,7 +320,7 @@ class SpesenGenerator:
         doc = Document(self.template_path)
         logger.debug(f"Vorlage geladen für: {spiel_info.get('heim_team', '')} vs {spiel_info.get('gast_team', '')}")
 
-        datum, anstoss = parse_anpfiff(spiel_info.get('anpfiff', ''))
+        _, datum, anstoss = parse_anpfiff_full(spiel_info.get('anpfiff', ''))
         checkboxes = self._determine_checkboxes(match_data)
 
         is_punktspiel = checkboxes['CHECKBOX_PUNKTSPIEL']
@@ -393,7 +393,7 @@ class SpesenGenerator:
                 spiel_info = match_data.get('spiel_info', {})
                 heim = spiel_info.get('heim_team', 'Unbekannt')
                 gast = spiel_info.get('gast_team', 'Unbekannt')
-                datum_iso = extract_iso_date_from_anpfiff(spiel_info.get('anpfiff', ''))
+                datum_iso = parse_anpfiff_full(spiel_info.get('anpfiff', ''))[0]
                 expenses = expenses_map.get((heim, gast, datum_iso))
 
                 logger.info(f"[{i}/{len(matches_data)}] Verarbeite: {heim} vs {gast}")
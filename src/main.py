@@ -4,15 +4,16 @@ Startet die FastAPI Backend-Anwendung
 """
 import os
 import json
+import asyncio
 from pathlib import Path
 from typing import Optional, Tuple, List
 from dotenv import load_dotenv
 
-from scraper.dfb_scraper import DFBScraper
 from generator.docx_generator import SpesenGenerator
 from utils.session_manager import SessionManager
 from utils.logger import setup_logger
 from utils.pdf_converter import convert_docx_files_to_pdf
+from scraper.storage_state import get_storage_state_path
 
 # Lade .env Datei
 env_path = Path(__file__).parent.parent / ".env"
@@ -21,6 +22,53 @@ load_dotenv(env_path)
 logger = setup_logger("main")
 
 
+async def _scrape_all_matches(
+    dfb_username: str,
+    dfb_password: str,
+    session_path: Path,
+    session_mgr: SessionManager
+) -> List[dict]:
+    """
+    Loggt sich bei DFB.net ein und scrapt alle Spiele (läuft im Event-Loop von asyncio.run).
+
+    Returns:
+        Liste der Spieldaten
+    """
+    # Playwright erst hier laden - die API importiert dieses Modul, scrapt aber nie selbst
+    from scraper.dfb_scraper import DFBScraper
+
+    try:
+        async with DFBScraper(
+            headless=True,
+            username=dfb_username,
+            password=dfb_password,
+            storage_state_path=get_storage_state_path(dfb_username, dfb_password)
+        ) as scraper:
+            # Navigation und Login
+            session_mgr.update_session_metadata(
+                session_path,
+                status="scraping",
+                progress={"current": 0, "total": 0, "step": "Login und Navigation..."}
+            )
+
+            await scraper.open_eigene_daten()
+
+            # Progress Callback für Scraping
+            def update_scraping_progress(current, total, step):
+                session_mgr.update_session_metadata(
+                    session_path,
+                    status="scraping",
+                    progress={"current": current, "total": total, "step": step}
+                )
+                logger.info(f"Progress: {current}/{total} - {step}")
+
+            # Alle Spiele scrapen MIT Progress-Callback
+            return await scraper.scrape_all_matches(progress_callback=update_scraping_progress)
+    finally:
+        # Scraping läuft in einem eigenen Prozess - Browser danach beenden
+        await DFBScraper.shutdown()
+
+
 def scrape_matches_with_session(
     session_path: Path = None,
     username: Optional[str] = None,
@@ -56,44 +104,19 @@ def scrape_matches_with_session(
         return None, None
 
     try:
-        with DFBScraper(headless=True, username=dfb_username, password=dfb_password) as scraper:
-            # Navigation und Login
-            session_mgr.update_session_metadata(
-                session_path,
-                status="scraping",
-                progress={"current": 0, "total": 0, "step": "Login und Navigation..."}
-            )
-
-            scraper.open_dfbnet()
-            scraper.accept_cookies()
-            scraper.click_login()
-            scraper.accept_cookies()
-            scraper.click_login()
-            scraper.login()
-            scraper.open_menu_if_needed()
-            scraper.navigate_to_schiriansetzung()
-
-            # Progress Callback für Scraping
-            def update_scraping_progress(current, total, step):
-                session_mgr.update_session_metadata(
-                    session_path,
-                    status="scraping",
-                    progress={"current": current, "total": total, "step": step}
-                )
-                logger.info(f"Progress: {current}/{total} - {step}")
-
-            # Alle Spiele scrapen MIT Progress-Callback
-            all_matches = scraper.scrape_all_matches(progress_callback=update_scraping_progress)
+        all_matches = asyncio.run(
+            _scrape_all_matches(dfb_username, dfb_password, session_path, session_mgr)
+        )
 
-            # Daten in Session speichern - AUCH BEI 0 SPIELEN!
-            output_file = session_path / "spesen_data.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(all_matches, f, ensure_ascii=False, indent=2)
+        # Daten in Session speichern - AUCH BEI 0 SPIELEN!
+        output_file = session_path / "spesen_data.json"
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(all_matches, f, ensure_ascii=False, indent=2)
 
-            logger.info(f"Daten gespeichert in: {output_file}")
-            logger.info(f"Erfolgreich {len(all_matches)} Spiele gescrapt")
+        logger.info(f"Daten gespeichert in: {output_file}")
+        logger.info(f"Erfolgreich {len(all_matches)} Spiele gescrapt")
 
-            return all_matches, session_path
+        return all_matches, session_path
 
     except Exception as e:
         logger.error(f"Fehler beim Scraping: {e}")
@@ -147,7 +170,7 @@ def generate_documents_in_session(matches_data: List[dict], session_path: Path,
     generator = SpesenGenerator(template_path, session_path)
     generated_files = []
 
-    from utils.match_utils import extract_iso_date_from_anpfiff
+    from utils.match_utils import parse_anpfiff_full
 
     for i, match_data in enumerate(matches_data, 1):
         try:
@@ -155,7 +178,8 @@ def generate_documents_in_session(matches_data: List[dict], session_path: Path,
             expenses = expenses_map.get((
                 spiel_info.get('heim_team', ''),
                 spiel_info.get('gast_team', ''),
-                extract_iso_date_from_anpfiff(spiel_info.get('anpfiff', '')),
+                # Gecacht - generate_document() parst denselben Anpfiff ohne erneuten Regex-Lauf
+                parse_anpfiff_full(spiel_info.get('anpfiff', ''))[0],
             ))
             output_path = generator.generate_document(match_data, expenses=expenses)
             generated_files.append(output_path)
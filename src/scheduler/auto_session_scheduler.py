@@ -4,6 +4,7 @@ Nutzt die bereits existierenden Funktionen aus main.py und main_api.py
 """
 import asyncio
 import multiprocessing
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
@@ -26,6 +27,11 @@ from main import scrape_matches_with_session, generate_documents_in_session
 
 logger = setup_logger("auto_scheduler")
 
+# Maximale Anzahl gleichzeitig laufender Generierungs-Prozesse.
+# Login und Navigation warten fast nur auf das Netzwerk, daher skaliert das
+# nahezu linear - begrenzt wird vor allem durch den RAM pro Chromium-Instanz.
+MAX_CONCURRENT_USERS = max(1, int(os.getenv("AUTO_SESSION_MAX_CONCURRENCY", "3")))
+
 
 def run_generation_for_user(
     user_id: int,
@@ -117,7 +123,7 @@ class AutoSessionScheduler:
         self.scheduler = AsyncIOScheduler()
         self.session_manager = SessionManager()
         self._is_running = False
-        logger.info("AutoSessionScheduler initialisiert (sequenziell, ein User nach dem anderen)")
+        logger.info(f"AutoSessionScheduler initialisiert (max. {MAX_CONCURRENT_USERS} User parallel)")
 
     async def process_user_session(self, user: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -162,7 +168,7 @@ class AutoSessionScheduler:
             )
             process.start()
 
-            # Warte bis Prozess fertig ist, bevor der naechste User drankommt
+            # Warte bis Prozess fertig ist, ohne den Event-Loop zu blockieren
             await asyncio.get_event_loop().run_in_executor(None, process.join)
 
             logger.info(f"[User {user_id}] Prozess abgeschlossen")
@@ -205,11 +211,14 @@ class AutoSessionScheduler:
                 logger.info("Keine User gefunden")
                 return
 
-            # Verarbeite alle User sequenziell, einen nach dem anderen
-            results = []
-            for user in users:
-                result = await self.process_user_session(user)
-                results.append(result)
+            # Verarbeite alle User parallel, begrenzt durch die Semaphore
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_USERS)
+
+            async def process_limited(user: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.process_user_session(user)
+
+            results = await asyncio.gather(*(process_limited(user) for user in users))
 
             # Zusammenfassung
             successful = sum(1 for r in results if r.get("success"))
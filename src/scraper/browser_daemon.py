@@ -0,0 +1,91 @@
+"""
+Browser-Daemon - hält einen Chromium dauerhaft am Laufen.
+
+Jede Generierung läuft in einem eigenen Prozess. Statt dort jedes Mal Chromium neu
+zu starten, verbinden sich die Scraper per CDP mit diesem Browser, sobald
+DFB_BROWSER_CDP_URL gesetzt ist (z.B. http://localhost:9222). Ist der Daemon nicht
+erreichbar, startet der Scraper wie bisher einen eigenen Browser.
+
+Der Browser wird regelmäßig ersetzt (nach DFB_BROWSER_MAX_AGE Sekunden oder
+DFB_BROWSER_MAX_USES Scraping-Durchläufen), aber nur, wenn gerade keine Seite offen ist.
+
+Start aus src/: python -m scraper.browser_daemon
+"""
+import asyncio
+import json
+import os
+import time
+import urllib.request
+
+from playwright.async_api import async_playwright, Browser, Playwright
+
+from scraper.dfb_scraper import CHROMIUM_ARGS
+from utils.logger import setup_logger
+
+logger = setup_logger("browser_daemon")
+
+CDP_PORT = int(os.getenv("DFB_BROWSER_CDP_PORT", "9222"))
+
+# Recycling: Chromium wächst mit der Zeit im Speicher, daher regelmäßig neu starten
+MAX_AGE = int(os.getenv("DFB_BROWSER_MAX_AGE", str(6 * 60 * 60)))
+MAX_USES = int(os.getenv("DFB_BROWSER_MAX_USES", "50"))
+
+# Wie oft geprüft wird, ob der Browser läuft und ob gerade gescrapt wird (Sekunden)
+CHECK_INTERVAL = 10
+
+
+def _open_page_count() -> int:
+    """Zählt die offenen Seiten im Browser über die CDP-HTTP-Schnittstelle"""
+    with urllib.request.urlopen(f"http://127.0.0.1:{CDP_PORT}/json/list", timeout=5) as response:
+        targets = json.load(response)
+    return sum(1 for target in targets if target.get("type") == "page")
+
+
+async def _launch(playwright: Playwright) -> Browser:
+    """Startet Chromium mit offenem CDP-Port"""
+    browser = await playwright.chromium.launch(
+        headless=True,
+        args=[*CHROMIUM_ARGS, f"--remote-debugging-port={CDP_PORT}"]
+    )
+    logger.info(f"Browser gestartet, CDP-Endpunkt: http://localhost:{CDP_PORT}")
+    return browser
+
+
+async def run_daemon():
+    """Hält den Browser am Laufen und ersetzt ihn bei Absturz oder nach Alter/Nutzung"""
+    async with async_playwright() as playwright:
+        browser = await _launch(playwright)
+        started = time.monotonic()
+        uses = 0
+        busy = False
+
+        while True:
+            await asyncio.sleep(CHECK_INTERVAL)
+
+            if not browser.is_connected():
+                logger.warning("Browser nicht mehr verbunden - starte neu")
+                browser = await _launch(playwright)
+                started, uses, busy = time.monotonic(), 0, False
+                continue
+
+            try:
+                open_pages = await asyncio.to_thread(_open_page_count)
+            except Exception as e:
+                logger.warning(f"CDP-Status nicht abrufbar: {e}")
+                continue
+
+            # Jeder Übergang von "leer" zu "Seiten offen" zählt als ein Scraping-Durchlauf
+            if open_pages and not busy:
+                uses += 1
+            busy = open_pages > 0
+
+            age = time.monotonic() - started
+            if not busy and (age > MAX_AGE or uses >= MAX_USES):
+                logger.info(f"Ersetze Browser (Alter: {age / 3600:.1f}h, Durchläufe: {uses})")
+                await browser.close()
+                browser = await _launch(playwright)
+                started, uses = time.monotonic(), 0
+
+
+if __name__ == "__main__":
+    asyncio.run(run_daemon())
@@ -1,21 +1,233 @@
-import sys
+import asyncio
+import json
+import logging
+import os
+import time
 from pathlib import Path
+from typing import AsyncIterator
 
-from playwright.sync_api import sync_playwright, Page, Browser
-
-# Füge src/ zum Path hinzu für Imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Locator, Playwright
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 
 from utils.logger import setup_logger
 from core.errors import DFBCredentialsInvalidError
-
-logger = setup_logger("dfb_scraper")
+from core.encryption import encrypt_credential, decrypt_credential
+
+# Handler werden erst beim ersten Scraper eingerichtet (setup_logger ist idempotent)
+logger = logging.getLogger("dfb_scraper")
+
+# Varianten des "Anmelden"-Buttons in Prioritätsreihenfolge (spezifischste zuerst)
+LOGIN_BUTTON_SELECTORS = [f'{selector}:visible' for selector in [
+    'button:has-text("Anmelden")',
+    'a:has-text("Anmelden")',
+    '[href*="login"]',
+    ':text("Anmelden")',
+    '.login',
+    '#login',
+]]
+
+# Alle Varianten als eine Selektor-Union: Playwright wartet in einem einzigen
+# Durchlauf auf irgendeine Alternative statt nacheinander auf jede
+LOGIN_BUTTON_SELECTOR = ', '.join(LOGIN_BUTTON_SELECTORS)
+
+# Ein Container pro Spiel in der Liste "Eigene Daten"
+MATCH_ITEM_SELECTOR = 'sria-matches-match-list-item'
+
+# Liefert pro Spiel-Container einen stabilen Zusatz-Selektor (data-match-id oder id),
+# oder null, wenn der Container keine Kennung trägt
+MATCH_KEYS_JS = """
+items => items.map(item => {
+    const matchId = item.getAttribute('data-match-id');
+    if (matchId) return `[data-match-id="${CSS.escape(matchId)}"]`;
+    return item.id ? `#${CSS.escape(item.id)}` : null;
+})
+"""
+
+USERNAME_FIELD_SELECTOR = 'input[placeholder*="Benutzerkennung"], input[name*="username"]'
+
+# Ressourcen-Typen, die der Scraper nie auswertet und deshalb gar nicht erst lädt.
+# Stylesheets bleiben erlaubt: Sichtbarkeitsprüfungen (Menü-Button, Modals) hängen vom CSS ab.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Tracking-/Analytics-Anbieter: werden unabhängig vom Ressourcen-Typ blockiert
+BLOCKED_URL_PARTS = (
+    "google-analytics",
+    "googletagmanager",
+    "doubleclick",
+    "hotjar",
+    "facebook",
+)
+
+# Chromium-Startparameter: /dev/shm ist in Docker nur 64 MB groß, Hintergrunddienste
+# (Sync, Updates, Erweiterungen, GPU-Prozess, Übersetzung) verbrauchen nur Zeit und
+# Speicher pro Seite. Bewusst ohne --single-process/--no-zygote: instabil bei
+# mehreren parallelen Kontexten.
+CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--mute-audio",
+    "--disable-gpu",
+    "--disable-features=Translate,BackForwardCache,AcceptCHFrame",
+]
+
+# Optional: CDP-Endpunkt eines dauerhaft laufenden Chromium (z.B. http://localhost:9222,
+# siehe scraper/browser_daemon.py). Ist er erreichbar, entfällt der Browser-Start pro Prozess
+BROWSER_CDP_URL = os.getenv("DFB_BROWSER_CDP_URL")
+
+# Debug: Alle XHR/Fetch-Antworten loggen, um die JSON-Endpunkte hinter den Modals zu finden
+LOG_XHR_RESPONSES = os.getenv("DFB_SCRAPER_LOG_XHR", "").lower() in ("1", "true", "yes")
+
+# Standard-Timeouts für alle Aktionen/Navigationen im Kontext (ms).
+# Falsche Selektoren fallen so nach 5s statt Playwrights 30s auf;
+# explizite timeout-Argumente gibt es nur noch, wo davon abgewichen wird.
+DEFAULT_TIMEOUT = 5000
+DEFAULT_NAVIGATION_TIMEOUT = 15000
+
+# Liest alle Felder des "Mehr Info"-Modals im Browser aus. Entspricht den früheren
+# Locator-Abfragen: Label-div (text-color-grey-5) suchen, dann im Elternelement den Wert.
+# fields: [[key, label], ...] für alle einfachen Label/Wert-Felder (DFBScraper.FIELD_MAP)
+MATCH_INFO_JS = """
+(modal, fields) => {
+    const text = node => node ? node.innerText.trim() : null;
+    const labels = [...modal.querySelectorAll('div.text-color-grey-5')];
+    const byLabel = (label, valueSelector) => {
+        const needle = label.toLowerCase();
+        const found = labels.find(div => div.textContent.toLowerCase().includes(needle));
+        return found ? text(found.parentElement.querySelector(valueSelector)) : null;
+    };
+    const info = {
+        anpfiff: text(modal.querySelector('.kickoff .fw-700')),
+        heim_team: byLabel('Heim', '.fs-lg.fw-700 span'),
+        gast_team: byLabel('Gast', '.fs-lg.fw-700 span'),
+    };
+    for (const [key, label] of fields) {
+        info[key] = byLabel(label, '.fw-700');
+    }
+    return info;
+}
+"""
+
+# Liest Name, Adresse und Platztyp aus dem Spielstätte-Modal. Wie zuvor die Playwright-
+# Selektoren text=/regex/ liefert matching() die innersten Elemente, deren Text passt.
+VENUE_INFO_JS = """
+modal => {
+    const text = node => node ? node.innerText.trim() : null;
+    const matching = re => [...modal.querySelectorAll('*')].filter(el =>
+        re.test(el.innerText || '') && ![...el.children].some(child => re.test(child.innerText || '')));
+
+    // Name: Untertitel, sonst erster span im Block des Geotag-Icons
+    let name = text(modal.querySelector('#modal-subtitle, .subtitle'));
+    if (!name) {
+        const geotag = modal.querySelector('dfb-geotag-icon');
+        const block = geotag && geotag.parentElement && geotag.parentElement.parentElement;
+        name = block ? text(block.querySelector('span')) : null;
+    }
+
+    // Adresse: erste Zeile mit PLZ (5 Ziffern), die mehr als nur die PLZ enthält
+    const adresse = matching(/\\d{5}/).map(text).find(line => line.length > 5);
+
+    const platzTyp = matching(/Rasenplatz|Kunstrasen|Hartplatz/)[0];
+
+    return {
+        name: name,
+        adresse: adresse === undefined ? null : adresse,
+        platz_typ: platzTyp ? text(platzTyp) : null,
+    };
+}
+"""
+
+# Liest alle Schiedsrichter-Blöcke eines Modals aus. Pro Feld wird (wie zuvor mit
+# text=-Selektoren) das innerste Label-Element gesucht und im Elternelement die letzte
+# Wert-Spalte gelesen - bei Telefon/E-Mail der Link darin.
+REFEREE_CONTACTS_JS = """
+items => items.map(item => {
+    const text = node => node ? node.innerText.trim() : null;
+    const label = re => [...item.querySelectorAll('*')].find(el =>
+        re.test(el.innerText || '') && ![...el.children].some(child => re.test(child.innerText || '')));
+    const value = (re, link) => {
+        const found = label(re);
+        if (!found) return null;
+        const columns = found.parentElement.querySelectorAll('.col-7, .col-sm-6');
+        const column = columns[columns.length - 1];
+        if (!column) return null;
+        return text(link ? column.querySelector('a') : column);
+    };
+    return {
+        header: text(item.querySelector('.mb-2.fw-700')),
+        // Mobil oder privat - manche haben beide, die erste gefundene zählt
+        telefon: value(/Telefon \\((mobil|privat)\\)/, true),
+        email: value(/e-mail/i, true),
+        strasse: value(/straße, nr\\./i, false),
+        plz_ort: value(/plz, ort/i, false),
+    };
+})
+"""
+
+# Gespeicherte Login-Zustände, die älter sind, gelten als abgelaufen (Sekunden)
+STORAGE_STATE_MAX_AGE = 6 * 60 * 60
+
+# Zusätzlicher Schlüssel im gespeicherten Zustand: URL von "Eigene Daten" für den Direkteinstieg
+EIGENE_DATEN_URL_KEY = "eigene_daten_url"
+
+# Maximale Anzahl paralleler Seiten (je ein eigener Kontext im selben Browser)
+# beim Scrapen der Spiele
+MAX_PARALLEL_PAGES = 4
+
+
+async def _block_unneeded_resources(route):
+    """Route-Handler: Bricht Requests für Bilder, Fonts, Medien und Tracker ab"""
+    request = route.request
+    if (request.resource_type in BLOCKED_RESOURCE_TYPES
+            or any(part in request.url for part in BLOCKED_URL_PARTS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _log_xhr_response(response):
+    """Response-Handler: Loggt Status, Methode und URL von XHR/Fetch-Antworten"""
+    request = response.request
+    if request.resource_type in ("xhr", "fetch"):
+        logger.info("XHR %s %s %s", response.status, request.method, response.url)
 
 
 class DFBScraper:
-    """Scraper für DFB.net Ansetzungen"""
-
-    def __init__(self, headless: bool = True, username: str = None, password: str = None):
+    """
+    Scraper für DFB.net Ansetzungen.
+
+    Läuft auf der async-API von Playwright, damit mehrere Seiten (Kontexte)
+    im selben Browser gleichzeitig Spiele abarbeiten können:
+
+        async with DFBScraper(username=..., password=...) as scraper:
+            ...
+            matches = await scraper.scrape_all_matches()
+    """
+
+    # Einfache Label/Wert-Felder im "Mehr Info"-Modal: Schlüssel im Ergebnis -> Label im Modal
+    FIELD_MAP = {
+        "mannschaftsart": "Mannschaftsart",
+        "spielklasse": "Spielklasse",
+        "staffel": "Staffel",
+        "spieltag": "Spieltag",
+    }
+
+    # Prozessweit geteilter Browser: Chromium wird nur einmal gestartet,
+    # jeder Scraper-Durchlauf bekommt nur einen eigenen BrowserContext.
+    # Gehört zum Event-Loop, in dem er gestartet wurde.
+    _playwright: Playwright | None = None
+    _shared_browser: Browser | None = None
+
+    def __init__(
+        self,
+        headless: bool = True,
+        username: str = None,
+        password: str = None,
+        browser: Browser | None = None,
+        storage_state_path: Path | None = None,
+        require_credentials: bool = True
+    ):
         """
         Initialisiert den Scraper.
 
@@ -23,55 +235,265 @@ class DFBScraper:
             headless: Browser im Hintergrund starten (False = sichtbar für Debugging)
             username: DFB.net Benutzername
             password: DFB.net Passwort
+            browser: Optional - bereits gestarteter Browser (z.B. aus einem Pool).
+                     Falls None, wird der geteilte Browser verwendet bzw. gestartet.
+            storage_state_path: Optional - Datei für den (verschlüsselten) Login-Zustand.
+                                Ist sie vorhanden, kann der komplette Login übersprungen werden.
+            require_credentials: Username/Passwort sofort prüfen (False nur für Test/Debug
+                                 ohne Login)
+
+        Raises:
+            ValueError: Wenn Username oder Passwort fehlen - noch bevor ein Browser startet
         """
+        setup_logger("dfb_scraper")
+
+        if require_credentials and (not username or not password):
+            logger.error("Username oder Passwort nicht gesetzt")
+            raise ValueError("Username und Passwort müssen angegeben werden")
+
         self.headless = headless
         self.username = username
         self.password = password
-        self.browser: Browser | None = None
+        self.browser: Browser | None = browser
+        self.context: BrowserContext | None = None
         self.page: Page | None = None
+        self.storage_state_path = storage_state_path
+        self._restored_session = False
+        self._eigene_daten_url: str | None = None
+        # True, sobald self.page die Spielliste ("Eigene Daten") zeigt
+        self._at_eigene_daten = False
+        # Anzahl Spiele laut get_all_matches() - gilt für alle Seiten mit derselben Liste
+        self._match_count = 0
+        # Stabile Selektoren pro Spiel (None: Container ohne eindeutige Kennung -> nth())
+        self._match_keys: list[str] | None = None
+        # Locator-Cache pro Seite (Locator sind lazy und wiederverwendbar)
+        self._locators: dict[str, Locator] = {}
+
+    def _loc(self, selector: str) -> Locator:
+        """Gibt den (gecachten) ersten Locator für einen Selektor zurück"""
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self.page.locator(selector).first
+            self._locators[selector] = locator
+        return locator
+
+    def _role(self, role: str, name: str) -> Locator:
+        """Wie _loc(), aber über die ARIA-Rolle statt einem :has-text-Scan aller Elemente"""
+        key = f"role={role}[name={name}]"
+        locator = self._locators.get(key)
+        if locator is None:
+            # Nicht exact: Groß-/Kleinschreibung wie bei :has-text ignorieren
+            locator = self.page.get_by_role(role, name=name).first
+            self._locators[key] = locator
+        return locator
+
+    @classmethod
+    async def start_browser(cls, headless: bool = True) -> Browser:
+        """
+        Startet Playwright + Chromium einmalig pro Prozess.
+
+        Ist DFB_BROWSER_CDP_URL gesetzt und erreichbar, wird stattdessen der dort laufende
+        Browser verwendet. Folgende Aufrufe geben den bereits verbundenen Browser zurück.
+        """
+        if cls._shared_browser is not None and cls._shared_browser.is_connected():
+            return cls._shared_browser
+
+        if cls._playwright is None:
+            cls._playwright = await async_playwright().start()
+
+        if BROWSER_CDP_URL:
+            try:
+                cls._shared_browser = await cls._playwright.chromium.connect_over_cdp(
+                    BROWSER_CDP_URL, timeout=DEFAULT_TIMEOUT
+                )
+                logger.info("Mit laufendem Browser verbunden: %s", BROWSER_CDP_URL)
+                return cls._shared_browser
+            except PlaywrightError as e:
+                logger.warning("Browser unter %s nicht erreichbar, starte eigenen: %s", BROWSER_CDP_URL, e)
 
-    def start(self):
-        """Startet den Browser"""
         logger.info("Starte Browser...")
+        cls._shared_browser = await cls._playwright.chromium.launch(headless=headless, args=CHROMIUM_ARGS)
+        logger.info("Browser gestartet (headless=%s)", headless)
+
+        return cls._shared_browser
+
+    @classmethod
+    async def shutdown(cls):
+        """
+        Schließt den geteilten Browser und beendet Playwright.
+
+        Bei einem per CDP verbundenen Browser wird nur die Verbindung getrennt -
+        der Browser selbst läuft für die nächsten Prozesse weiter.
+        """
+        if cls._shared_browser is not None:
+            logger.info("Schließe Browser...")
+            await cls._shared_browser.close()
+            cls._shared_browser = None
+            logger.info("Browser geschlossen")
 
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=self.headless)
+        if cls._playwright is not None:
+            await cls._playwright.stop()
+            cls._playwright = None
 
-        # Browser-Kontext mit fester Größe erstellen
-        context = self.browser.new_context(
+    async def _new_context(self, storage_state: dict | None = None) -> BrowserContext:
+        """Erstellt einen Browser-Kontext mit fester Größe, Timeouts und Ressourcen-Filter"""
+        context = await self.browser.new_context(
             viewport={'width': 1920, 'height': 1080},
-            screen={'width': 1920, 'height': 1080}
+            screen={'width': 1920, 'height': 1080},
+            storage_state=storage_state
         )
-        self.page = context.new_page()
+        context.set_default_timeout(DEFAULT_TIMEOUT)
+        context.set_default_navigation_timeout(DEFAULT_NAVIGATION_TIMEOUT)
+        # Auf Kontext-Ebene, damit auch neu geöffnete Tabs (Eigene Daten) profitieren
+        await context.route("**/*", _block_unneeded_resources)
+        if LOG_XHR_RESPONSES:
+            context.on("response", _log_xhr_response)
+        return context
+
+    async def start_session(self):
+        """Öffnet einen neuen Browser-Kontext mit eigener Seite"""
+        storage_state = self._load_storage_state()
+        self._restored_session = storage_state is not None
+
+        self.context = await self._new_context(storage_state)
+        self.page = await self.context.new_page()
+        self._locators.clear()
+
+        logger.info("Browser-Kontext geöffnet (1920x1080)")
+
+    async def start(self):
+        """Startet den Browser (falls nötig) und öffnet einen neuen Kontext"""
+        if self.browser is None:
+            self.browser = await self.start_browser(self.headless)
+
+        await self.start_session()
+
+    async def stop(self):
+        """Schließt den Browser-Kontext (der Browser selbst läuft weiter)"""
+        if self.context:
+            logger.info("Schließe Browser-Kontext...")
+            await self.context.close()
+            self.context = None
+            self.page = None
+            self._locators.clear()
+            logger.info("Browser-Kontext geschlossen")
+
+    def _load_storage_state(self) -> dict | None:
+        """Lädt den gespeicherten Login-Zustand (Cookies, LocalStorage), falls vorhanden"""
+        if not self.storage_state_path or not self.storage_state_path.exists():
+            return None
+
+        age = time.time() - os.path.getmtime(self.storage_state_path)
+        if age > STORAGE_STATE_MAX_AGE:
+            logger.info("Gespeicherter Login-Zustand ist %.1f Stunden alt - verwerfe ihn", age / 3600)
+            self.invalidate_session()
+            return None
 
-        logger.info(f"Browser gestartet (headless={self.headless}, 1920x1080)")
+        try:
+            encrypted = self.storage_state_path.read_text(encoding='utf-8')
+            storage_state = json.loads(decrypt_credential(encrypted))
+            # Kein Playwright-Feld - vor new_context() entfernen
+            self._eigene_daten_url = storage_state.pop(EIGENE_DATEN_URL_KEY, None)
+            return storage_state
+        except Exception as e:
+            logger.warning("Gespeicherter Login-Zustand nicht lesbar: %s", e)
+            self.invalidate_session()
+            return None
 
-    def stop(self):
-        """Stoppt den Browser"""
-        if self.browser:
-            logger.info("Schließe Browser...")
-            self.browser.close()
-            self.playwright.stop()
-            logger.info("Browser geschlossen")
+    async def save_session(self):
+        """Speichert den aktuellen Login-Zustand verschlüsselt auf der Festplatte"""
+        if not self.storage_state_path or not self.context:
+            return
+
+        try:
+            storage_state = await self.context.storage_state()
+            if self._eigene_daten_url:
+                storage_state[EIGENE_DATEN_URL_KEY] = self._eigene_daten_url
+            self.storage_state_path.parent.mkdir(parents=True, exist_ok=True)
+            self.storage_state_path.write_text(
+                encrypt_credential(json.dumps(storage_state)),
+                encoding='utf-8'
+            )
+            # Enthält Session-Cookies - nur für den Besitzer lesbar
+            os.chmod(self.storage_state_path, 0o600)
+            logger.info("Login-Zustand gespeichert")
+        except Exception as e:
+            logger.warning("Login-Zustand konnte nicht gespeichert werden: %s", e)
+
+    def invalidate_session(self):
+        """Löscht den gespeicherten Login-Zustand"""
+        if self.storage_state_path:
+            self.storage_state_path.unlink(missing_ok=True)
+
+    async def restore_session(self) -> bool:
+        """
+        Versucht, mit dem gespeicherten Login-Zustand direkt eingeloggt weiterzumachen.
+
+        Returns:
+            True wenn der gespeicherte Login noch gültig ist (Login kann übersprungen werden).
+            False wenn kein oder ein abgelaufener Zustand vorlag - dann ist ein frischer
+            Kontext ohne alte Cookies geöffnet und der normale Login-Ablauf nötig.
+        """
+        if not self._restored_session:
+            return False
+
+        logger.info("Gespeicherter Login-Zustand gefunden, prüfe Gültigkeit...")
+
+        # Direkt zu "Eigene Daten" springen - spart Startseite, Menü und neuen Tab
+        if self._eigene_daten_url and await self._open_eigene_daten_directly():
+            logger.info("Gespeicherter Login gültig - direkt bei Eigene Daten eingestiegen")
+            return True
+
+        await self.open_dfbnet()
+
+        if "auth.dfbnet.org" not in self.page.url:
+            try:
+                await self.page.locator('text=Schiriansetzung').first.wait_for(state="visible")
+                logger.info("Gespeicherter Login gültig - überspringe Login")
+                return True
+            except PlaywrightTimeoutError:
+                pass
+
+        logger.info("Gespeicherter Login abgelaufen - melde neu an")
+        self.invalidate_session()
+        await self.stop()
+        await self.start_session()
+        return False
 
-    def open_dfbnet(self):
+    async def _open_eigene_daten_directly(self) -> bool:
+        """
+        Öffnet die gespeicherte Eigene-Daten-URL.
+
+        Returns:
+            True wenn die Spielliste angezeigt wird, False bei Weiterleitung zum Login
+            oder wenn die Seite keine Spielliste zeigt
+        """
+        try:
+            await self.page.goto(self._eigene_daten_url, wait_until="domcontentloaded")
+            if "auth.dfbnet.org" in self.page.url:
+                return False
+
+            await self.page.locator(MATCH_ITEM_SELECTOR).first.wait_for(state="attached")
+            self._at_eigene_daten = True
+            return True
+        except PlaywrightError as e:
+            logger.info("Direkteinstieg bei Eigene Daten nicht möglich: %s", e)
+            return False
+
+    async def open_dfbnet(self):
         """Öffnet die DFB.net Startseite"""
         logger.info("Öffne dfbnet.org...")
 
-        # Weniger strikte Bedingung + längeres Timeout
-        self.page.goto(
-            "https://www.dfbnet.org",
-            wait_until="domcontentloaded",
-            timeout=60000
-        )
-
-        # Titel ausgeben
-        title = self.page.title()
-        logger.info(f"Seite geladen: {title}")
+        # Nur auf den Commit der Navigation warten - accept_cookies() wartet
+        # ohnehin gezielt auf das Cookie-Banner
+        try:
+            await self.page.goto("https://www.dfbnet.org", wait_until="commit")
+        except PlaywrightTimeoutError:
+            logger.warning("Navigation zu dfbnet.org nicht rechtzeitig bestätigt - fahre fort")
 
-        return title
+        logger.info("Seite geöffnet: %s", self.page.url)
 
-    def accept_cookies(self):
+    async def accept_cookies(self):
         """Akzeptiert das Cookie-Banner"""
         logger.info("Suche Cookie-Banner...")
 
@@ -79,612 +501,699 @@ class DFBScraper:
             logger.info("Warte auf Cookie-Banner...")
 
             # Direkter, einfacherer Ansatz
-            accept_button = self.page.locator('button:has-text("Alle akzeptieren")').first
-            accept_button.wait_for(state="visible", timeout=30000)
+            accept_button = self._role("button", "Alle akzeptieren")
+            await accept_button.wait_for(state="visible", timeout=DEFAULT_NAVIGATION_TIMEOUT)
 
             logger.info("Cookie-Banner gefunden, klicke...")
-            accept_button.click()
+            await accept_button.click()
 
             # Warte bis Banner VERSCHWUNDEN ist
-            accept_button.wait_for(state="hidden", timeout=10000)
+            await accept_button.wait_for(state="hidden")
             logger.info("Cookies akzeptiert")
 
         except Exception as e:
-            logger.warning(f"Cookie-Banner konnte nicht geklickt werden: {e}")
+            logger.warning("Cookie-Banner konnte nicht geklickt werden: %s", e)
             logger.info("Fahre trotzdem fort...")
 
-    def click_login(self):
+    async def click_login(self):
         """Klickt auf den Anmelden-Button"""
         logger.info("Suche Anmelden-Button...")
 
         try:
-            # Verschiedene Selektoren für "Anmelden" probieren
-            selectors = [
-                'button:has-text("Anmelden")',
-                'a:has-text("Anmelden")',
-                '[href*="login"]',
-                'text=Anmelden',
-                '.login',
-                '#login'
-            ]
-
-            for selector in selectors:
-                logger.info(f"Versuche Selektor: {selector}")
-                try:
-                    login_button = self.page.locator(selector).first
-                    if login_button.is_visible(timeout=3000):
-                        logger.info(f"Anmelden-Button gefunden mit: {selector}")
-                        login_button.click()
-                        self.page.wait_for_timeout(3000)
-                        logger.info("Anmelden-Button geklickt")
-                        return
-                except:
-                    continue
-
-            logger.error("Anmelden-Button mit keinem Selektor gefunden")
-            raise Exception("Anmelden-Button nicht gefunden")
+            # Ein Locator für alle Selektor-Varianten
+            login_button = self._loc(LOGIN_BUTTON_SELECTOR)
+            try:
+                await login_button.wait_for(state="visible")
+            except PlaywrightTimeoutError:
+                logger.error("Anmelden-Button mit keinem Selektor gefunden")
+                raise Exception("Anmelden-Button nicht gefunden")
+
+            # Die Union liefert den ersten Treffer in Dokumentreihenfolge - daher die
+            # Varianten nach Priorität prüfen (is_visible() wartet nicht)
+            for selector in LOGIN_BUTTON_SELECTORS:
+                if await self._loc(selector).is_visible():
+                    login_button = self._loc(selector)
+                    break
+
+            logger.info("Anmelden-Button gefunden, klicke...")
+            await login_button.click()
+            # Kein Warten nach dem Klick: Der nächste Schritt (Cookie-Banner bzw.
+            # Login-Formular in login()) wartet selbst auf die neue Seite
+            logger.info("Anmelden-Button geklickt")
 
         except Exception as e:
-            logger.error(f"Fehler beim Klicken auf Anmelden: {e}")
+            logger.error("Fehler beim Klicken auf Anmelden: %s", e)
             raise
 
-    def login(self):
+    async def login(self):
         """Füllt Login-Formular aus und meldet sich an"""
         logger.info("Fülle Login-Formular aus...")
 
-        if not self.username or not self.password:
-            logger.error("Username oder Passwort nicht gesetzt")
-            raise ValueError("Username und Passwort müssen angegeben werden")
-
         try:
-            # Warte bis Login-Formular sichtbar ist
-            self.page.wait_for_selector('input[placeholder*="Benutzerkennung"], input[name*="username"]', timeout=20000)
-
-            # Benutzername eingeben
-            username_field = self.page.locator('input[placeholder*="Benutzerkennung"], input[name*="username"]').first
-            username_field.fill(self.username)
+            # Warte bis Login-Formular sichtbar ist und gib Benutzername ein
+            username_field = self._loc(USERNAME_FIELD_SELECTOR)
+            await username_field.wait_for(state="visible", timeout=DEFAULT_NAVIGATION_TIMEOUT)
+            await username_field.fill(self.username)
             logger.info("Benutzername eingegeben")
 
             # Passwort eingeben
-            password_field = self.page.locator('input[placeholder*="Passwort"], input[type="password"]').first
-            password_field.fill(self.password)
+            password_field = self._loc('input[placeholder*="Passwort"], input[type="password"]')
+            await password_field.fill(self.password)
             logger.info("Passwort eingegeben")
 
             # Anmelden-Button im Formular klicken
-            login_submit = self.page.locator('button:has-text("ANMELDEN")').first
-            login_submit.click()
+            login_submit = self._role("button", "ANMELDEN")
+            await login_submit.click()
             logger.info("Login-Button geklickt")
 
-            # Warte und prüfe ob Login erfolgreich war
+            # 1. Prüfung: Weiterleitung weg von auth.dfbnet.org - läuft um die Wette mit
+            # einer Fehlermeldung, damit falsche Zugangsdaten nicht den vollen Timeout kosten
             logger.info("Warte auf Antwort vom Server...")
-            self.page.wait_for_timeout(10000)
-
-            # Prüfe mehrere Indikatoren für erfolgreichen Login
-            current_url = self.page.url
-            logger.info(f"Aktuelle URL nach Login: {current_url}")
-
-            # 1. Prüfung: Sind wir auf einer anderen Domain?
-            if "auth.dfbnet.org" not in current_url:
-                logger.info("Login erfolgreich - Weitergeleitet zu DFBnet")
+            # Um die Wette nur mit der eindeutigen Fehlermeldung von DFBnet - die breite Suche
+            # trifft auch andere sichtbare Elemente mit "error" in der Klasse und ist daher
+            # nur die Momentaufnahme im Fehlerfall unten
+            login_error = self.page.locator('.alert-error').first
+            if await self._wait_for_login_redirect(login_error):
+                logger.info("Login erfolgreich - Weitergeleitet zu DFBnet: %s", self.page.url)
+                await self.save_session()
                 return
+            logger.info("Keine Weiterleitung nach Login, aktuelle URL: %s", self.page.url)
+
+            # Ab hier nur noch der Fehlerfall: Fehlermeldung oder Timeout sind bereits
+            # eingetreten, daher reichen Momentaufnahmen statt weiterer Wartezeiten
 
             # 2. Prüfung: Gibt es eine Fehlermeldung?
+            error_message = self.page.locator('.alert-error, .error, [class*="error"]').first
             try:
-                error_message = self.page.locator('.alert-error, .error, [class*="error"]').first
-                if error_message.is_visible(timeout=2000):
-                    error_text = error_message.inner_text()
-                    logger.error(f"Login-Fehler: {error_text}")
+                if await error_message.is_visible():
+                    error_text = await error_message.inner_text()
+                    logger.error("Login-Fehler: %s", error_text)
                     # GEÄNDERT: Spezifische Exception werfen
                     raise DFBCredentialsInvalidError(f"DFBnet meldet: {error_text}")
-            except DFBCredentialsInvalidError:
-                raise  # Weiterleiten
-            except:
+            except PlaywrightError:
+                # Element zwischenzeitlich verschwunden
                 pass
 
             # 3. Prüfung: Ist Login-Formular noch sichtbar?
-            if self.page.locator('input[type="password"]').is_visible(timeout=3000):
+            if await self._loc('input[type="password"]').is_visible():
                 logger.error("Login fehlgeschlagen - Login-Formular noch sichtbar")
                 # GEÄNDERT: Spezifische Exception werfen
                 raise DFBCredentialsInvalidError()
 
             # Wenn wir hier sind, war Login erfolgreich
             logger.info("Login erfolgreich")
+            await self.save_session()
 
         except DFBCredentialsInvalidError:
             raise  # Weiterleiten ohne zu wrappen
         except Exception as e:
-            logger.error(f"Fehler beim Login: {e}")
+            logger.error("Fehler beim Login: %s", e)
             raise
 
-    def open_menu_if_needed(self):
+    async def _wait_for_login_redirect(self, error_message: Locator) -> bool:
+        """
+        Wartet auf die Weiterleitung weg von auth.dfbnet.org oder eine Fehlermeldung -
+        je nachdem, was zuerst eintritt.
+
+        Returns:
+            True wenn die Weiterleitung erfolgt ist
+        """
+        redirect = asyncio.ensure_future(
+            self.page.wait_for_url(lambda url: "auth.dfbnet.org" not in url, wait_until="commit")
+        )
+        error = asyncio.ensure_future(
+            error_message.wait_for(state="visible", timeout=DEFAULT_NAVIGATION_TIMEOUT)
+        )
+        done, pending = await asyncio.wait({redirect, error}, return_when=asyncio.FIRST_COMPLETED)
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        if redirect in done and redirect.exception() is None:
+            return True
+
+        # Fehlermeldung (oder Timeout) zuerst - Weiterleitung kann trotzdem gerade passiert sein
+        if error in done:
+            error.exception()  # Timeout/Fehler als abgerufen markieren
+        return "auth.dfbnet.org" not in self.page.url
+
+    async def open_eigene_daten(self):
+        """
+        Kompletter Weg bis zur Spielliste: gespeicherten Login nutzen oder neu anmelden,
+        dann über das Menü zu Schiriansetzung -> Eigene Daten.
+        """
+        # Gespeicherter Login-Zustand erspart den kompletten Login-Ablauf
+        if not await self.restore_session():
+            await self.open_dfbnet()
+            await self.accept_cookies()
+            await self.click_login()
+            await self.accept_cookies()
+            await self.click_login()
+            await self.login()
+        await self.open_menu_if_needed()
+        await self.navigate_to_schiriansetzung()
+
+    async def open_menu_if_needed(self):
         """Öffnet das Menü, falls es noch geschlossen ist"""
         logger.info("Prüfe ob Menü geöffnet werden muss...")
 
+        if self._at_eigene_daten:
+            logger.info("Bereits bei Eigene Daten - Menü nicht nötig")
+            return
+
         try:
             # Suche nach dem Menü-Button (nur bei kleinen Bildschirmen sichtbar)
-            menu_button = self.page.locator('#dfb-Menu-toggle, button[ng-click*="menuBtnClicked"]').first
+            menu_button = self._loc('#dfb-Menu-toggle, button[ng-click*="menuBtnClicked"]')
 
             # Prüfe ob Button existiert und sichtbar ist
-            if menu_button.is_visible(timeout=3000):
-                logger.info("Menü-Button gefunden, klicke...")
-                menu_button.click()
-                self.page.wait_for_timeout(2000)
-                logger.info("Menü geöffnet")
-            else:
+            try:
+                await menu_button.wait_for(state="visible", timeout=1500)
+            except PlaywrightTimeoutError:
                 logger.info("Menü-Button nicht sichtbar - Menü bereits offen")
+                return
+
+            logger.info("Menü-Button gefunden, klicke...")
+            await menu_button.click()
+            # Kein Warten nötig: navigate_to_schiriansetzung() wartet auf den Menüpunkt
+            logger.info("Menü geöffnet")
 
         except Exception as e:
             logger.info("Menü-Button nicht gefunden - Menü wahrscheinlich bereits offen")
             # Kein Fehler werfen, da dies normal ist bei großen Bildschirmen
 
-    def navigate_to_schiriansetzung(self):
+    async def navigate_to_schiriansetzung(self):
         """Navigiert zu Schiriansetzung -> Eigene Daten"""
+        if self._at_eigene_daten:
+            logger.info("Bereits bei Eigene Daten - überspringe Navigation")
+            return
+
         logger.info("Navigiere zu Schiriansetzung...")
 
         try:
             # Schritt 1: Auf "Schiriansetzung" klicken
             schiri_menu = self.page.locator('text=Schiriansetzung').first
-            schiri_menu.wait_for(state="visible", timeout=15000)
+            await schiri_menu.wait_for(state="visible", timeout=15000)
             logger.info("Schiriansetzung-Menüpunkt gefunden, klicke...")
-            schiri_menu.click()
+            await schiri_menu.click()
 
             # Warte bis Untermenü SICHTBAR ist
             eigene_daten = self.page.locator('text=Eigene Daten').first
-            eigene_daten.wait_for(state="visible", timeout=10000)
+            await eigene_daten.wait_for(state="visible")
 
             # Schritt 2: Auf "Eigene Daten" klicken
             logger.info("Eigene Daten gefunden, klicke...")
 
             # Neuen Tab erwarten
-            with self.page.context.expect_page() as new_page_info:
-                eigene_daten.click()
+            async with self.page.context.expect_page() as new_page_info:
+                await eigene_daten.click()
 
             # Wechsle zum neuen Tab
-            new_page = new_page_info.value
-            new_page.wait_for_load_state("domcontentloaded", timeout=30000)
+            new_page = await new_page_info.value
+            await new_page.wait_for_load_state("domcontentloaded")
 
-            # Update page reference
+            # Update page reference (gecachte Locator gehören zur alten Seite)
             self.page = new_page
+            self._locators.clear()
+            self._at_eigene_daten = True
 
-            logger.info(f"Neue Seite geöffnet: {self.page.url}")
+            logger.info("Neue Seite geöffnet: %s", self.page.url)
             logger.info("Erfolgreich zu Eigene Daten navigiert")
 
+            # URL für den Direkteinstieg beim nächsten Lauf merken
+            if self.page.url != self._eigene_daten_url:
+                self._eigene_daten_url = self.page.url
+                await self.save_session()
+
         except Exception as e:
-            logger.error(f"Fehler beim Navigieren zu Schiriansetzung: {e}")
+            logger.error("Fehler beim Navigieren zu Schiriansetzung: %s", e)
             raise
 
-    def get_all_matches(self):
+    async def get_all_matches(self):
         """Sammelt alle Spiele von der Seite"""
         logger.info("Sammle alle Spiele...")
 
         try:
-            # Kurz warten bis Seite geladen ist
-            self.page.wait_for_timeout(2000)
-
-            # Finde alle Spiel-Container (jeder Container = 1 Spiel)
-            match_containers = self.page.locator('sria-matches-match-list-item').all()
-
-            anzahl_spiele = len(match_containers)
-            logger.info(f"Gefunden: {anzahl_spiele} Spiele")
+            # Warten bis die Spielliste gerendert ist statt fix 2 Sekunden
+            match_items = self.page.locator(MATCH_ITEM_SELECTOR)
+            try:
+                await match_items.first.wait_for(state="attached")
+            except PlaywrightTimeoutError:
+                logger.info("Keine Spiele auf der Seite gefunden")
+
+            # Jeder Container = 1 Spiel. Kennungen einmal einsammeln, damit die Container
+            # später ohne erneute Abfrage der Liste adressiert werden können
+            match_keys = await match_items.evaluate_all(MATCH_KEYS_JS)
+            anzahl_spiele = len(match_keys)
+            self._match_count = anzahl_spiele
+            self._match_keys = match_keys if self._keys_usable(match_keys) else None
+            logger.info("Gefunden: %s Spiele", anzahl_spiele)
 
             return anzahl_spiele
 
         except Exception as e:
-            logger.error(f"Fehler beim Sammeln der Spiele: {e}")
+            logger.error("Fehler beim Sammeln der Spiele: %s", e)
             raise
 
-    def open_mehr_info_modal(self, index: int):
-        """Öffnet das 'Mehr Info' Modal für ein bestimmtes Spiel"""
-        logger.info(f"Öffne Mehr Info Modal für Spiel {index + 1}...")
+    @staticmethod
+    def _keys_usable(match_keys: list) -> bool:
+        """Kennungen nur nutzen, wenn jedes Spiel eine eigene hat"""
+        return all(match_keys) and len(set(match_keys)) == len(match_keys)
 
-        try:
-            # Finde alle Spiel-Container
-            match_containers = self.page.locator('sria-matches-match-list-item').all()
+    def _match_container(self, index: int, page: Page) -> Locator:
+        """
+        Gibt den Container des Spiels mit dem Index zurück (ohne Roundtrip zum Browser).
 
-            if index >= len(match_containers):
-                raise Exception(f"Spiel {index + 1} nicht gefunden")
+        Über die Kennung aus get_all_matches() trifft der Locator auch dann das richtige
+        Spiel, wenn sich die Liste zwischenzeitlich verschiebt; ohne Kennung per Position.
+        """
+        if index >= self._match_count:
+            raise Exception(f"Spiel {index + 1} nicht gefunden")
+        if self._match_keys:
+            return page.locator(MATCH_ITEM_SELECTOR + self._match_keys[index])
+        return page.locator(MATCH_ITEM_SELECTOR).nth(index)
 
+    async def open_mehr_info_modal(self, index: int, page: Page | None = None):
+        """Öffnet das 'Mehr Info' Modal für ein bestimmtes Spiel"""
+        logger.info("Öffne Mehr Info Modal für Spiel %s...", index + 1)
+        page = page or self.page
+
+        try:
             # Hole den spezifischen Container
-            container = match_containers[index]
+            container = self._match_container(index, page)
 
             # Finde "Mehr Info" Button innerhalb dieses Containers
             mehr_info = container.locator('sria-matches-game-details-modal').first
 
-            if mehr_info.is_visible():
-                mehr_info.click()
-
-                # Warte bis Modal SICHTBAR ist
-                modal = self.page.locator('.dfb-modal').first
-                modal.wait_for(state="visible", timeout=10000)
+            # click() wartet selbst auf Sichtbarkeit - keine separate is_visible()-Abfrage
+            try:
+                await mehr_info.click()
+            except PlaywrightTimeoutError:
+                raise Exception("Mehr Info Button nicht sichtbar")
 
-                # Warte bis Inhalt geladen ist (z.B. Anpfiff-Zeit)
-                self.page.locator('.dfb-modal .kickoff .fw-700').first.wait_for(state="visible", timeout=8000)
+            # Ein Wait genügt: Der Inhalt (z.B. Anpfiff-Zeit) ist erst sichtbar, wenn das Modal
+            # sichtbar ist und die Daten vom Server gerendert wurden
+            await page.locator('.dfb-modal .kickoff .fw-700').first.wait_for(state="visible")
 
-                logger.info("Mehr Info Modal geöffnet")
-            else:
-                raise Exception("Mehr Info Button nicht sichtbar")
+            logger.info("Mehr Info Modal geöffnet")
 
         except Exception as e:
-            logger.error(f"Fehler beim Öffnen des Modals: {e}")
+            logger.error("Fehler beim Öffnen des Modals: %s", e)
             raise
 
-    def close_modal(self):
-        """Schließt ein geöffnetes Modal"""
-        logger.info("Schließe Modal...")
-
-        try:
-            # Suche nach dem Schließen-Button (X)
-            close_button = self.page.locator('button[aria-label="Close"], .modal-close, [class*="close"]').first
+    async def close_modal(self, page: Page | None = None):
+        """
+        Schließt ein geöffnetes Modal.
 
-            if close_button.is_visible(timeout=5000):
-                close_button.click()
+        Zuerst per ESC (kein Suchen nach dem X-Button), nur wenn das Modal danach noch
+        offen ist, über den Schließen-Button.
+        """
+        logger.info("Schließe Modal...")
+        page = page or self.page
 
-                # Warte bis Modal NICHT mehr sichtbar ist
-                modal = self.page.locator('.modal.show, [role="dialog"], .dfb-modal')
-                modal.wait_for(state="hidden", timeout=8000)
+        # .first: Die Selektoren können Wrapper und Dialog desselben Modals treffen
+        modal = page.locator('.modal.show, [role="dialog"], .dfb-modal').first
 
-                logger.info("Modal geschlossen")
-            else:
-                # Alternative: ESC-Taste drücken
-                self.page.keyboard.press('Escape')
+        await page.keyboard.press('Escape')
+        try:
+            await modal.wait_for(state="hidden", timeout=1500)
+            logger.info("Modal mit ESC geschlossen")
+            return
+        except PlaywrightTimeoutError:
+            logger.info("Modal nach ESC noch offen, nutze Schließen-Button")
 
-                # Warte bis Modal verschwunden ist
-                modal = self.page.locator('.modal.show, [role="dialog"], .dfb-modal')
-                modal.wait_for(state="hidden", timeout=8000)
+        try:
+            # Suche nach dem Schließen-Button (X)
+            close_button = page.locator('button[aria-label="Close"], .modal-close, [class*="close"]').first
+            await close_button.click()
 
-                logger.info("Modal mit ESC geschlossen")
+            # Warte bis Modal NICHT mehr sichtbar ist
+            await modal.wait_for(state="hidden", timeout=3000)
+            logger.info("Modal geschlossen")
 
         except Exception as e:
-            logger.warning(f"Fehler beim Schließen des Modals: {e}")
-            # Versuche ESC als Fallback
-            self.page.keyboard.press('Escape')
-            self.page.wait_for_timeout(1000)
+            logger.warning("Fehler beim Schließen des Modals: %s", e)
 
-    def extract_match_info_from_modal(self):
+    async def extract_match_info_from_modal(self, page: Page | None = None):
         """
         Extrahiert Spielinformationen aus dem geöffneten 'Mehr Info' Modal.
         WICHTIG: Sucht nur innerhalb des sichtbaren Modals!
+        Erwartet ein per open_mehr_info_modal() geöffnetes Modal (dort wird auf den Inhalt gewartet).
         """
         logger.info("Extrahiere Spielinformationen aus Modal...")
+        page = page or self.page
 
         try:
-            match_info = {}
-
             # WICHTIG: Wir suchen nur im Modal, nicht auf der ganzen Seite!
             # Das Modal hat die Klasse 'dfb-modal'
-            modal = self.page.locator('.dfb-modal').first
-
-            # Warte kurz bis Modal vollständig geladen ist
-            modal.wait_for(state="visible", timeout=5000)
-
-            # Anpfiff (Datum + Uhrzeit) - NUR im Modal suchen
-            anpfiff = modal.locator('.kickoff .fw-700').first
-            if anpfiff.is_visible(timeout=5000):
-                match_info['anpfiff'] = anpfiff.inner_text().strip()
-
-            # Heim-Team - Präziser Selektor: Suche nach dem div mit "Heim" und dann dem nachfolgenden fw-700 span
-            heim_section = modal.locator('div.text-color-grey-5:has-text("Heim")').first
-            if heim_section.is_visible(timeout=3000):
-                # Gehe zum Elternelement und finde das fw-700 span mit dem Teamnamen
-                heim_parent = heim_section.locator('..')
-                heim_team = heim_parent.locator('.fs-lg.fw-700 span').first
-                if heim_team.is_visible(timeout=3000):
-                    match_info['heim_team'] = heim_team.inner_text().strip()
-
-            # Gast-Team - Gleiches Prinzip
-            gast_section = modal.locator('div.text-color-grey-5:has-text("Gast")').first
-            if gast_section.is_visible(timeout=3000):
-                gast_parent = gast_section.locator('..')
-                gast_team = gast_parent.locator('.fs-lg.fw-700 span').first
-                if gast_team.is_visible(timeout=3000):
-                    match_info['gast_team'] = gast_team.inner_text().strip()
-
-            # Mannschaftsart - Suche nach dem Label und nimm das nächste fw-700 Element
-            mannschaftsart_label = modal.locator('div.text-color-grey-5:has-text("Mannschaftsart")').first
-            if mannschaftsart_label.is_visible(timeout=3000):
-                mannschaftsart_parent = mannschaftsart_label.locator('..')
-                mannschaftsart = mannschaftsart_parent.locator('.fw-700').first
-                if mannschaftsart.is_visible(timeout=3000):
-                    match_info['mannschaftsart'] = mannschaftsart.inner_text().strip()
-
-            # Spielklasse
-            spielklasse_label = modal.locator('div.text-color-grey-5:has-text("Spielklasse")').first
-            if spielklasse_label.is_visible(timeout=3000):
-                spielklasse_parent = spielklasse_label.locator('..')
-                spielklasse = spielklasse_parent.locator('.fw-700').first
-                if spielklasse.is_visible(timeout=3000):
-                    match_info['spielklasse'] = spielklasse.inner_text().strip()
-
-            # Staffel
-            staffel_label = modal.locator('div.text-color-grey-5:has-text("Staffel")').first
-            if staffel_label.is_visible(timeout=3000):
-                staffel_parent = staffel_label.locator('..')
-                staffel = staffel_parent.locator('.fw-700').first
-                if staffel.is_visible(timeout=3000):
-                    match_info['staffel'] = staffel.inner_text().strip()
-
-            # Spieltag
-            spieltag_label = modal.locator('div.text-color-grey-5:has-text("Spieltag")').first
-            if spieltag_label.is_visible(timeout=3000):
-                spieltag_parent = spieltag_label.locator('..')
-                spieltag = spieltag_parent.locator('.fw-700').first
-                if spieltag.is_visible(timeout=3000):
-                    match_info['spieltag'] = spieltag.inner_text().strip()
-
-            logger.info(f"Extrahiert: {match_info.get('heim_team', '?')} vs {match_info.get('gast_team', '?')}")
+            # Kein eigenes Warten: open_mehr_info_modal() hat bereits auf den Inhalt gewartet
+            modal = page.locator('.dfb-modal').first
+
+            # Alle Felder in einem einzigen Roundtrip auslesen statt einzeln pro Feld
+            fields = await modal.evaluate(MATCH_INFO_JS, list(self.FIELD_MAP.items()))
+            match_info = {key: value for key, value in fields.items() if value}
+
+            logger.info("Extrahiert: %s vs %s", match_info.get('heim_team', '?'), match_info.get('gast_team', '?'))
             return match_info
 
         except Exception as e:
-            logger.error(f"Fehler beim Extrahieren der Spielinformationen: {e}")
+            logger.error("Fehler beim Extrahieren der Spielinformationen: %s", e)
             return {}
 
-    def open_referee_modal(self, match_index: int):
+    async def open_referee_modal(self, match_index: int, page: Page | None = None):
         """Öffnet das Schiedsrichter-Kontakte Modal für ein Spiel"""
-        logger.info(f"Öffne Schiedsrichter-Modal für Spiel {match_index + 1}...")
+        logger.info("Öffne Schiedsrichter-Modal für Spiel %s...", match_index + 1)
+        page = page or self.page
 
         try:
             # Finde den Spiel-Container
-            match_containers = self.page.locator('sria-matches-match-list-item').all()
-
-            if match_index >= len(match_containers):
-                raise Exception(f"Spiel {match_index + 1} nicht gefunden")
-
-            container = match_containers[match_index]
+            container = self._match_container(match_index, page)
 
             # Finde das Schiedsrichter-Modal Element
             referee_modal = container.locator('sria-matches-referees-contact-details-modal').first
 
-            if referee_modal.is_visible():
-                referee_modal.click()
-
-                # Warte bis Modal sichtbar ist
-                modal = self.page.locator('.modal.show, [role="dialog"]').first
-                modal.wait_for(state="visible", timeout=10000)
+            try:
+                await referee_modal.click()
+            except PlaywrightTimeoutError:
+                raise Exception("Schiedsrichter-Modal Button nicht sichtbar")
 
-                # Warte bis erster Schiedsrichter geladen ist
-                self.page.locator('sria-matches-referee-contact-details-list-item').first.wait_for(
-                    state="visible",
-                    timeout=8000
-                )
+            # Warte bis erster Schiedsrichter geladen ist (setzt ein sichtbares Modal voraus)
+            await page.locator('sria-matches-referee-contact-details-list-item').first.wait_for(state="visible")
 
-                logger.info("Schiedsrichter-Modal geöffnet")
-            else:
-                raise Exception("Schiedsrichter-Modal Button nicht sichtbar")
+            logger.info("Schiedsrichter-Modal geöffnet")
 
         except Exception as e:
-            logger.error(f"Fehler beim Öffnen des Schiedsrichter-Modals: {e}")
+            logger.error("Fehler beim Öffnen des Schiedsrichter-Modals: %s", e)
             raise
 
-    def extract_referee_contacts(self):
+    async def extract_referee_contacts(self, page: Page | None = None):
         """
         Extrahiert Schiedsrichter-Kontaktdaten aus dem geöffneten Modal.
         WICHTIG: Sucht nur innerhalb des sichtbaren Modals!
+        Erwartet ein per open_referee_modal() geöffnetes Modal (dort wird auf den Inhalt gewartet).
         """
         logger.info("Extrahiere Schiedsrichter-Kontakte...")
+        page = page or self.page
 
         try:
             referees = []
 
             # WICHTIG: Nur im Modal suchen!
-            modal = self.page.locator('.modal.show, [role="dialog"]').first
-            modal.wait_for(state="visible", timeout=5000)
-
-            # Finde alle Schiedsrichter-Blöcke NUR im Modal
-            referee_items = modal.locator('sria-matches-referee-contact-details-list-item').all()
-
-            for item in referee_items:
-                try:
-                    referee_data = {}
-
-                    # Rolle und Name aus dem ersten fw-700 div (z.B. "SR Louis Gaudes" oder "SRA 1 Jan Vogt")
-                    header = item.locator('.mb-2.fw-700').first
-                    if header.is_visible(timeout=2000):
-                        header_text = header.inner_text().strip()
-                        # Parse "SR Louis Gaudes" oder "SRA 1 Jan Vogt"
-                        parts = header_text.split(maxsplit=2)
-                        if len(parts) >= 2:
-                            # Wenn es "SRA 1" ist, kombiniere die ersten zwei Teile
-                            if parts[0] in ['SR', 'SRA', 'Beo']:
-                                if parts[0] == 'SRA' and len(parts) >= 3:
-                                    referee_data['rolle'] = f"{parts[0]} {parts[1]}"  # "SRA 1"
-                                    referee_data['name'] = parts[2] if len(parts) > 2 else ''
-                                else:
-                                    referee_data['rolle'] = parts[0]  # "SR"
-                                    referee_data['name'] = ' '.join(parts[1:])
-
-                    # Telefon - kann mobil oder privat sein, manche haben beide
-                    telefon_row = item.locator('text=/Telefon \\(mobil\\)|Telefon \\(privat\\)/')
-                    if telefon_row.count() > 0:
-                        # Nimm die erste Telefonnummer die wir finden
-                        telefon_elem = telefon_row.first.locator('..').locator('.col-7, .col-sm-6').last
-                        if telefon_elem.is_visible(timeout=2000):
-                            telefon_link = telefon_elem.locator('a')
-                            if telefon_link.is_visible(timeout=2000):
-                                referee_data['telefon'] = telefon_link.inner_text().strip()
-
-                    # E-Mail
-                    email_row = item.locator('text=E-Mail').locator('..')
-                    if email_row.is_visible(timeout=2000):
-                        email_col = email_row.locator('.col-7, .col-sm-6').last
-                        if email_col.is_visible(timeout=2000):
-                            email_link = email_col.locator('a')
-                            if email_link.is_visible(timeout=2000):
-                                referee_data['email'] = email_link.inner_text().strip()
-
-                    # Straße
-                    strasse_row = item.locator('text=Straße, Nr.').locator('..')
-                    if strasse_row.is_visible(timeout=2000):
-                        strasse_col = strasse_row.locator('.col-7, .col-sm-6').last
-                        if strasse_col.is_visible(timeout=2000):
-                            referee_data['strasse'] = strasse_col.inner_text().strip()
-
-                    # PLZ, Ort
-                    plz_row = item.locator('text=PLZ, Ort').locator('..')
-                    if plz_row.is_visible(timeout=2000):
-                        plz_col = plz_row.locator('.col-7, .col-sm-6').last
-                        if plz_col.is_visible(timeout=2000):
-                            referee_data['plz_ort'] = plz_col.inner_text().strip()
-
-                    if referee_data and 'rolle' in referee_data:
-                        referees.append(referee_data)
-
-                except Exception as e:
-                    logger.warning(f"Fehler beim Extrahieren eines Schiedsrichters: {e}")
-                    continue
-
-            logger.info(f"Extrahiert: {len(referees)} Schiedsrichter")
+            modal = page.locator('.modal.show, [role="dialog"]').first
+
+            # Alle Schiedsrichter-Blöcke NUR im Modal - in einem einzigen Roundtrip auslesen
+            raw_referees = await modal.locator('sria-matches-referee-contact-details-list-item').evaluate_all(
+                REFEREE_CONTACTS_JS
+            )
+
+            for raw in raw_referees:
+                referee_data = {}
+
+                # Rolle und Name aus dem ersten fw-700 div (z.B. "SR Louis Gaudes" oder "SRA 1 Jan Vogt")
+                header_text = raw.pop('header')
+                if header_text:
+                    # Parse "SR Louis Gaudes" oder "SRA 1 Jan Vogt"
+                    parts = header_text.split(maxsplit=2)
+                    if len(parts) >= 2:
+                        # Wenn es "SRA 1" ist, kombiniere die ersten zwei Teile
+                        if parts[0] in ['SR', 'SRA', 'Beo']:
+                            if parts[0] == 'SRA' and len(parts) >= 3:
+                                referee_data['rolle'] = f"{parts[0]} {parts[1]}"  # "SRA 1"
+                                referee_data['name'] = parts[2] if len(parts) > 2 else ''
+                            else:
+                                referee_data['rolle'] = parts[0]  # "SR"
+                                referee_data['name'] = ' '.join(parts[1:])
+
+                # Telefon, E-Mail, Straße, PLZ/Ort - nur was vorhanden ist
+                referee_data.update({key: value for key, value in raw.items() if value is not None})
+
+                if 'rolle' in referee_data:
+                    referees.append(referee_data)
+
+            logger.info("Extrahiert: %s Schiedsrichter", len(referees))
             return referees
 
         except Exception as e:
-            logger.error(f"Fehler beim Extrahieren der Schiedsrichter-Kontakte: {e}")
+            logger.error("Fehler beim Extrahieren der Schiedsrichter-Kontakte: %s", e)
             return []
 
-    def open_venue_modal(self, match_index: int):
+    async def open_venue_modal(self, match_index: int, page: Page | None = None):
         """Öffnet das Spielstätte-Modal für ein Spiel"""
-        logger.info(f"Öffne Spielstätte-Modal für Spiel {match_index + 1}...")
+        logger.info("Öffne Spielstätte-Modal für Spiel %s...", match_index + 1)
+        page = page or self.page
 
         try:
             # Finde den Spiel-Container
-            match_containers = self.page.locator('sria-matches-match-list-item').all()
-
-            if match_index >= len(match_containers):
-                raise Exception(f"Spiel {match_index + 1} nicht gefunden")
-
-            container = match_containers[match_index]
+            container = self._match_container(match_index, page)
 
             # Finde das Spielstätte-Modal Element (mit Geotag-Icon)
             venue_modal = container.locator('sria-matches-venue-details-modal').first
 
-            if venue_modal.is_visible():
-                venue_modal.click()
-
-                # Warte bis Modal sichtbar ist
-                modal = self.page.locator('.modal.show, [role="dialog"]').first
-                modal.wait_for(state="visible", timeout=10000)
+            try:
+                await venue_modal.click()
+            except PlaywrightTimeoutError:
+                raise Exception("Spielstätte-Modal Button nicht sichtbar")
 
-                # Warte bis Venue-Name geladen ist
-                venue_name = modal.locator('#modal-subtitle, .subtitle, dfb-geotag-icon').first
-                venue_name.wait_for(state="visible", timeout=8000)
+            # Warte bis Venue-Name im Modal geladen ist (setzt ein sichtbares Modal voraus)
+            modal = page.locator('.modal.show, [role="dialog"]').first
+            venue_name = modal.locator('#modal-subtitle, .subtitle, dfb-geotag-icon').first
+            await venue_name.wait_for(state="visible")
 
-                logger.info("Spielstätte-Modal geöffnet")
-            else:
-                raise Exception("Spielstätte-Modal Button nicht sichtbar")
+            logger.info("Spielstätte-Modal geöffnet")
 
         except Exception as e:
-            logger.error(f"Fehler beim Öffnen des Spielstätte-Modals: {e}")
+            logger.error("Fehler beim Öffnen des Spielstätte-Modals: %s", e)
             raise
 
-    def extract_venue_info(self):
+    async def extract_venue_info(self, page: Page | None = None):
         """
         Extrahiert Spielstätten-Informationen aus dem geöffneten Modal.
         WICHTIG: Sucht nur innerhalb des sichtbaren Modals!
+        Erwartet ein per open_venue_modal() geöffnetes Modal (dort wird auf den Inhalt gewartet).
         """
         logger.info("Extrahiere Spielstätten-Informationen...")
+        page = page or self.page
 
         try:
-            venue_info = {}
-
             # WICHTIG: Nur im Modal suchen!
-            modal = self.page.locator('.modal.show, [role="dialog"]').first
-            modal.wait_for(state="visible", timeout=5000)
-
-            # Spielstätte Name - suche im Modal nach dem Subtitle
-            venue_name_elem = modal.locator('#modal-subtitle, .subtitle').first
-            if venue_name_elem.is_visible(timeout=3000):
-                venue_info['name'] = venue_name_elem.inner_text().strip()
-
-            # Falls leer, versuche alternativen Selektor im Modal
-            if not venue_info.get('name'):
-                # Suche nach dem span mit dem Venue-Namen
-                venue_span = modal.locator('dfb-geotag-icon').locator('..').locator('..').locator('span').first
-                if venue_span.is_visible(timeout=3000):
-                    venue_info['name'] = venue_span.inner_text().strip()
-
-            # Adresse - NUR im Modal
-            address = modal.locator('dfb-geotag-icon').locator('..').locator('..').locator('div').filter(
-                has_text='/Str|straße|platz/').first
-            if address.is_visible(timeout=3000):
-                venue_info['adresse'] = address.inner_text().strip()
-            else:
-                # Alternativer Ansatz: Suche nach der Adresszeile im Modal
-                address_lines = modal.locator('text=/\\d{5}/').all()  # Suche nach PLZ (5 Ziffern)
-                if address_lines:
-                    for line in address_lines:
-                        text = line.inner_text().strip()
-                        if len(text) > 5:  # Mehr als nur PLZ
-                            venue_info['adresse'] = text
-                            break
-
-            # Rasenplatz / Kunstrasen - NUR im Modal
-            platz_typ = modal.locator('text=/Rasenplatz|Kunstrasen|Hartplatz/').first
-            if platz_typ.is_visible(timeout=2000):
-                venue_info['platz_typ'] = platz_typ.inner_text().strip()
-
-            logger.info(f"Extrahiert: {venue_info.get('name', '?')}")
+            modal = page.locator('.modal.show, [role="dialog"]').first
+
+            # Name, Adresse und Platztyp in einem einzigen Roundtrip auslesen
+            fields = await modal.evaluate(VENUE_INFO_JS)
+            venue_info = {key: value for key, value in fields.items() if value is not None}
+
+            logger.info("Extrahiert: %s", venue_info.get('name', '?'))
             return venue_info
 
         except Exception as e:
-            logger.error(f"Fehler beim Extrahieren der Spielstätten-Info: {e}")
+            logger.error("Fehler beim Extrahieren der Spielstätten-Info: %s", e)
             return {}
 
-    def scrape_all_matches(self, progress_callback=None):
+    async def _open_worker_page(self, url: str, storage_state: dict) -> Page | None:
         """
-        Scrapt alle Spiele und sammelt die Daten
+        Öffnet die Eigene-Daten-Seite in einem zusätzlichen Kontext mit dem Login-Zustand
+        der Hauptseite.
+
+        Returns:
+            Die Seite, oder None falls sie nicht dieselbe Spielliste zeigt
+        """
+        context = None
+        try:
+            context = await self._new_context(storage_state)
+            page = await context.new_page()
+            await page.goto(url, wait_until="domcontentloaded")
+
+            match_items = page.locator(MATCH_ITEM_SELECTOR)
+            await match_items.first.wait_for(state="visible")
+
+            # Indizes müssen auf allen Seiten dasselbe Spiel bezeichnen
+            match_keys = await match_items.evaluate_all(MATCH_KEYS_JS)
+            if len(match_keys) != self._match_count or (self._match_keys and match_keys != self._match_keys):
+                raise Exception("Spielliste weicht von der Hauptseite ab")
+
+            return page
+
+        except Exception as e:
+            logger.warning("Zusätzliche Seite für paralleles Scraping nicht verfügbar: %s", e)
+            if context is not None:
+                await context.close()
+            return None
+
+    async def _scrape_match(self, page: Page, index: int, anzahl_spiele: int) -> dict | None:
+        """Scrapt alle drei Modals eines Spiels auf der übergebenen Seite"""
+        logger.info("--- Verarbeite Spiel %s/%s ---", index + 1, anzahl_spiele)
+
+        try:
+            match_data = {}
+
+            # 1. Spielinformationen
+            await self.open_mehr_info_modal(index, page)
+            match_data['spiel_info'] = await self.extract_match_info_from_modal(page)
+            await self.close_modal(page)
+
+            # 2. Schiedsrichter-Kontakte
+            await self.open_referee_modal(index, page)
+            match_data['schiedsrichter'] = await self.extract_referee_contacts(page)
+            await self.close_modal(page)
+
+            # 3. Spielstätte
+            await self.open_venue_modal(index, page)
+            match_data['spielstaette'] = await self.extract_venue_info(page)
+            await self.close_modal(page)
+
+            logger.info(
+                "✓ Spiel %s: %s vs %s",
+                index + 1,
+                match_data.get('spiel_info', {}).get('heim_team', '?'),
+                match_data.get('spiel_info', {}).get('gast_team', '?')
+            )
+            return match_data
+
+        except Exception as e:
+            logger.error("Fehler bei Spiel %s: %s", index + 1, e)
+            # Fahre mit nächstem Spiel fort
+            return None
+
+    async def iter_matches(
+        self,
+        anzahl_spiele: int | None = None,
+        max_pages: int = MAX_PARALLEL_PAGES
+    ) -> AsyncIterator[tuple[int, dict | None]]:
+        """
+        Scrapt alle Spiele und liefert jedes Ergebnis, sobald es vorliegt.
+
+        Die Spiele werden auf bis zu max_pages Seiten parallel abgearbeitet: Die Hauptseite
+        legt sofort los, zusätzliche Kontexte (mit dem Login-Zustand der Hauptseite) steigen
+        ein, sobald sie die Spielliste geladen haben. Kann ein zusätzlicher Kontext die Liste
+        nicht laden, übernehmen die anderen Seiten dessen Spiele.
+
+        Args:
+            anzahl_spiele: Anzahl Spiele, falls get_all_matches() schon aufgerufen wurde
+            max_pages: Maximale Anzahl parallel arbeitender Seiten (1 = sequenziell)
+
+        Yields:
+            (index, spieldaten) in Reihenfolge der Fertigstellung - spieldaten ist None,
+            wenn das Spiel nicht gescrapt werden konnte
+        """
+        if anzahl_spiele is None:
+            anzahl_spiele = await self.get_all_matches()
+
+        pending: asyncio.Queue[int] = asyncio.Queue()
+        for i in range(anzahl_spiele):
+            pending.put_nowait(i)
+        # None markiert das Ende aller Worker
+        finished: asyncio.Queue[tuple[int, dict | None] | None] = asyncio.Queue()
+
+        async def work(page: Page):
+            """Holt sich so lange das nächste offene Spiel, bis keins mehr übrig ist"""
+            while True:
+                try:
+                    index = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                finished.put_nowait((index, await self._scrape_match(page, index, anzahl_spiele)))
+
+        async def work_on_extra_page(url: str, storage_state: dict):
+            page = await self._open_worker_page(url, storage_state)
+            if page is None:
+                return
+            try:
+                await work(page)
+            finally:
+                await page.context.close()
+
+        async def run_workers():
+            try:
+                extra_pages = min(max_pages, anzahl_spiele) - 1
+                if extra_pages > 0:
+                    logger.info("Scrape parallel auf %s Seiten", extra_pages + 1)
+                    storage_state = await self.page.context.storage_state()
+                    await asyncio.gather(
+                        work(self.page),
+                        *(work_on_extra_page(self.page.url, storage_state) for _ in range(extra_pages))
+                    )
+                else:
+                    await work(self.page)
+            finally:
+                finished.put_nowait(None)
+
+        runner = asyncio.ensure_future(run_workers())
+        try:
+            while (result := await finished.get()) is not None:
+                yield result
+            # Fehler der Worker weiterreichen
+            await runner
+        finally:
+            # Bricht der Aufrufer die Iteration ab, laufen keine Worker weiter
+            if not runner.done():
+                runner.cancel()
+                await asyncio.gather(runner, return_exceptions=True)
+
+    async def scrape_all_matches(self, progress_callback=None, max_pages: int = MAX_PARALLEL_PAGES):
+        """
+        Scrapt alle Spiele und sammelt die Daten (siehe iter_matches()).
 
         Args:
             progress_callback: Optional callback function(current, total, step) für Fortschritts-Updates
+            max_pages: Maximale Anzahl parallel arbeitender Seiten (1 = sequenziell)
+
+        Returns:
+            Liste der Spieldaten in der Reihenfolge der Seite
         """
         logger.info("=== Starte Scraping aller Spiele ===")
 
-        all_matches = []
-        anzahl_spiele = self.get_all_matches()
+        anzahl_spiele = await self.get_all_matches()
 
         # Initial progress
         if progress_callback:
             progress_callback(0, anzahl_spiele, "Scraping gestartet...")
 
-        for i in range(anzahl_spiele):
-            logger.info(f"--- Verarbeite Spiel {i + 1}/{anzahl_spiele} ---")
+        results: dict[int, dict] = {}
+        processed = 0
+        async for index, match_data in self.iter_matches(anzahl_spiele, max_pages):
+            if match_data is not None:
+                results[index] = match_data
+            processed += 1
 
-            try:
-                match_data = {}
+            # Progress update nach jedem gescrapten Spiel
+            if progress_callback:
+                progress_callback(processed, anzahl_spiele, f"Scraping Spiel {processed}/{anzahl_spiele}")
 
-                # 1. Spielinformationen
-                self.open_mehr_info_modal(i)
-                match_data['spiel_info'] = self.extract_match_info_from_modal()
-                self.close_modal()
+        all_matches = [results[i] for i in sorted(results)]
+        logger.info("=== Scraping abgeschlossen: %s/%s Spiele erfolgreich ===", len(all_matches), anzahl_spiele)
+        return all_matches
 
-                # 2. Schiedsrichter-Kontakte
-                self.open_referee_modal(i)
-                match_data['schiedsrichter'] = self.extract_referee_contacts()
-                self.close_modal()
+    async def __aenter__(self):
+        """Context Manager: Automatisches Starten"""
+        await self.start()
+        return self
 
-                # 3. Spielstätte
-                self.open_venue_modal(i)
-                match_data['spielstaette'] = self.extract_venue_info()
-                self.close_modal()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context Manager: Schließt nur den Kontext, nicht den Browser"""
+        await self.stop()
 
-                all_matches.append(match_data)
-                logger.info(
-                    f"✓ Spiel {i + 1}: {match_data.get('spiel_info', {}).get('heim_team', '?')} vs {match_data.get('spiel_info', {}).get('gast_team', '?')}")
 
-                #Progress update nach jedem gescrapten Spiel
-                if progress_callback:
-                    progress_callback(i + 1, anzahl_spiele, f"Scraping Spiel {i + 1}/{anzahl_spiele}")
+async def main():
+    """
+    Debug-Einstieg: Scrapt mit DFB_USERNAME/DFB_PASSWORD aus der Umgebung und gibt die
+    Spieldaten als JSON aus. Aufruf aus src/: python -m scraper.dfb_scraper
+    """
+    headless = os.getenv("DFB_SCRAPER_HEADLESS", "true").lower() not in ("0", "false", "no")
 
-            except Exception as e:
-                logger.error(f"Fehler bei Spiel {i + 1}: {e}")
-                # Fahre mit nächstem Spiel fort
-                continue
+    try:
+        async with DFBScraper(
+            headless=headless,
+            username=os.getenv("DFB_USERNAME"),
+            password=os.getenv("DFB_PASSWORD")
+        ) as scraper:
+            await scraper.open_eigene_daten()
+            matches = await scraper.scrape_all_matches()
+    finally:
+        await DFBScraper.shutdown()
 
-        logger.info(f"=== Scraping abgeschlossen: {len(all_matches)}/{anzahl_spiele} Spiele erfolgreich ===")
-        return all_matches
+    print(json.dumps(matches, ensure_ascii=False, indent=2))
 
-    def __enter__(self):
-        """Context Manager: Automatisches Starten"""
-        self.start()
-        return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context Manager: Automatisches Beenden"""
-        self.stop()
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,41 @@
+"""
+Gespeicherte DFBnet-Login-Zustände (Playwright storage_state) pro DFB-Account.
+
+Bewusst ohne Playwright-Import - die API nutzt das Modul beim Ändern der Credentials.
+"""
+import hashlib
+import hmac
+import os
+from pathlib import Path
+
+from core.encryption import get_encryption_key
+
+# Standard-Ablage der Playwright-Login-Zustände (Projekt-Root)
+DEFAULT_STORAGE_STATE_DIR = Path(__file__).parent.parent.parent / ".dfb_sessions"
+
+
+def get_storage_state_dir() -> Path:
+    """Verzeichnis der Login-Zustände (erst beim Aufruf gelesen - die .env wird nach den Imports geladen)"""
+    return Path(os.getenv("DFB_STORAGE_STATE_DIR", DEFAULT_STORAGE_STATE_DIR))
+
+
+def get_storage_state_path(dfb_username: str, dfb_password: str) -> Path:
+    """
+    Gibt den Pfad zum gespeicherten Login-Zustand eines DFB-Accounts zurück.
+
+    Der Dateiname ist ein HMAC über Benutzername UND Passwort (Schlüssel: ENCRYPTION_KEY).
+    Nur wer das richtige Passwort angibt, bekommt die gespeicherten Cookies - mit
+    fremdem Benutzernamen und falschem Passwort gibt es keinen Treffer und damit
+    einen normalen Login, den DFBnet ablehnt.
+    """
+    account_key = hmac.new(
+        get_encryption_key(),
+        f"{dfb_username}\0{dfb_password}".encode(),
+        hashlib.sha256
+    ).hexdigest()[:32]
+    return get_storage_state_dir() / f"{account_key}.json"
+
+
+def delete_storage_state(dfb_username: str, dfb_password: str):
+    """Löscht den gespeicherten Login-Zustand (z.B. wenn sich die Credentials ändern)"""
+    get_storage_state_path(dfb_username, dfb_password).unlink(missing_ok=True)
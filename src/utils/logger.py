@@ -1,5 +1,102 @@
+import atexit
 import logging
+import logging.handlers
+import multiprocessing.util
+import os
+import queue
 import sys
+import threading
+import time
+from typing import Dict
+
+
+class _FastTimeFormatter(logging.Formatter):
+    """Formatter mit festem Zeitformat "YYYY-MM-DD HH:MM:SS" ohne strftime pro Record"""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        t = time.localtime(record.created)
+        return "%04d-%02d-%02d %02d:%02d:%02d" % t[:6]
+
+
+# Ein Handler für alle Logger (eine gemeinsame Sperre). Im Hauptprozess schreibt ihn
+# der Listener-Thread - die Reihenfolge gegenüber print()-Ausgaben ist dort nicht garantiert.
+_console_handler = logging.StreamHandler(sys.stdout)
+# Format: [2025-01-15 14:30:45] INFO - Nachricht
+_console_handler.setFormatter(_FastTimeFormatter('[%(asctime)s] %(levelname)s - %(message)s'))
+
+
+class _ConsoleQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler, der ohne laufenden Listener direkt auf die Konsole schreibt"""
+
+    def emit(self, record: logging.LogRecord):
+        if _listener is None:
+            _console_handler.handle(record)
+        else:
+            super().emit(record)
+
+
+# Die Logger legen Records nur in die Queue (konstante Zeit), geschrieben wird
+# in einem Hintergrund-Thread des QueueListeners
+_log_queue: queue.Queue = queue.Queue(-1)
+_queue_handler = _ConsoleQueueHandler(_log_queue)
+_listener: logging.handlers.QueueListener | None = None
+
+# Nur im Hauptprozess. Worker-Prozesse (multiprocessing) enden über os._exit() ohne
+# atexit - ein Listener-Thread würde dort mit noch wartenden Records abgebrochen.
+_use_listener = True
+
+# Bereits eingerichtete Logger - danach ist setup_logger() ein reiner Dict-Lookup ohne Sperre
+_init_lock = threading.Lock()
+_configured: Dict[str, bool] = {}
+
+
+def _start_listener():
+    """Startet den QueueListener (einmal pro Prozess, nicht in Worker-Prozessen)"""
+    global _listener
+    if _listener is not None or not _use_listener:
+        return
+    _listener = logging.handlers.QueueListener(_log_queue, _console_handler)
+    _listener.start()
+    atexit.register(_stop_listener)
+
+
+def _stop_listener():
+    """Stoppt den Listener; wartende Records werden vorher noch geschrieben"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+
+
+def _reset_after_fork():
+    """
+    Der Listener-Thread überlebt fork() nicht, und die Queue-Sperre kann im Kind
+    noch belegt sein. Im Kindprozess daher mit frischer Queue synchron loggen.
+    """
+    global _log_queue, _listener, _init_lock, _use_listener
+    _init_lock = threading.Lock()
+    _log_queue = queue.Queue(-1)
+    _queue_handler.queue = _log_queue
+    _listener = None
+    _use_listener = False
+
+
+def _on_worker_start(_handler):
+    """
+    Start eines multiprocessing-Workers (auch spawn/forkserver): Ein beim Import
+    gestarteter Listener wird geleert und gestoppt, ab dann wird synchron geloggt.
+    """
+    global _use_listener
+    _use_listener = False
+    _stop_listener()
+
+
+multiprocessing.util.register_after_fork(_queue_handler, _on_worker_start)
+
+# stdout vor einem fork() leeren - sonst gibt der Kindprozess gepufferte Zeilen ein zweites Mal aus
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_console_handler.flush, after_in_child=_reset_after_fork)
 
 
 def setup_logger(name: str = "dfb_scraper", level: int = logging.INFO) -> logging.Logger:
@@ -13,24 +110,25 @@ def setup_logger(name: str = "dfb_scraper", level: int = logging.INFO) -> loggin
     Returns:
         Konfigurierter Logger
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
+    # Bereits eingerichtet: Nichts zu tun (auch kein setLevel(), das jedes Mal
+    # den Level-Cache aller Logger leert)
+    if _configured.get(name):
+        return logging.getLogger(name)
 
-    # Verhindere doppelte Handler
-    if logger.handlers:
-        return logger
+    with _init_lock:
+        logger = logging.getLogger(name)
+        if _configured.get(name):
+            return logger
 
-    # Console Handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
+        # Logger mit eigenen Handlern (von außen konfiguriert) nicht anfassen
+        if not logger.handlers:
+            logger.setLevel(level)
 
-    # Format: [2025-01-15 14:30:45] INFO - Nachricht
-    formatter = logging.Formatter(
-        '[%(asctime)s] %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(formatter)
+            # Queue Handler (geteilt, filtert selbst nicht - das Level setzt der Logger);
+            # die Ausgabe übernimmt der Listener über den Console Handler
+            logger.addHandler(_queue_handler)
+            _start_listener()
 
-    logger.addHandler(console_handler)
+        _configured[name] = True
 
-    return logger
\ No newline at end of file
+    return logger
@@ -2,41 +2,65 @@
 Session Manager - Verwaltet Session-basierte Ausgabeordner fuer Web-Anfragen
 VERBESSERT: Findet automatisch das Projekt-Root
 """
+import logging
 import os
-import secrets
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-import json
 from typing import Dict, List, Optional
 
+import orjson
+
 from utils.logger import setup_logger
 
-logger = setup_logger("session_manager")
+# Nur den Logger holen - eingerichtet wird er einmalig beim ersten SessionManager
+logger = logging.getLogger("session_manager")
+
+# Reine Fortschritts-Updates werden höchstens so oft auf die Platte geschrieben (Sekunden)
+METADATA_FLUSH_INTERVAL = 0.25
 
 
+@lru_cache(maxsize=1)
 def find_project_root() -> Path:
     """
     Findet das Projekt-Root-Verzeichnis (wo .env liegt).
     Sucht von der aktuellen Datei aus nach oben.
+    Das Ergebnis ändert sich während eines Prozesses nicht und wird daher gecacht.
     """
-    current = Path(__file__).resolve()
-
-    # Gehe von utils/session_manager.py aus nach oben
+    # Mit Strings statt Path-Objekten arbeiten - ein stat() pro Probe, keine Path-Instanzen
     # utils/session_manager.py -> utils/ -> src/ -> projekt-root/
-    for parent in [current.parent, current.parent.parent, current.parent.parent.parent]:
-        # Pruefe ob .env oder .git existiert (typische Root-Marker)
-        if (parent / ".env").exists() or (parent / ".git").exists():
-            return parent
+    directory = os.path.dirname(os.path.realpath(__file__))
+    candidates = []
+    for _ in range(3):
+        candidates.append(directory)
+        directory = os.path.dirname(directory)
+
+    for parent in candidates:
+        # Pruefe ob .env oder .git existiert (typische Root-Marker);
+        # .git kann in Worktrees auch eine Datei sein
+        if os.path.isfile(os.path.join(parent, ".env")) or os.path.exists(os.path.join(parent, ".git")):
+            return Path(parent)
 
     # Fallback: 2 Ebenen hoch von dieser Datei
     # session_manager.py liegt in src/utils/
     # -> src/utils/ -> src/ -> projekt-root/
-    return current.parent.parent.parent
+    return Path(candidates[-1])
 
 
 class SessionManager:
     """Verwaltet Session-Ordner fuer parallele Web-Anfragen"""
 
+    # Metadata-Cache - prozessweit geteilt, da im selben Prozess mehrere
+    # SessionManager-Instanzen dieselbe Session aktualisieren
+    _meta_cache: Dict[Path, dict] = {}
+    _meta_mtime: Dict[Path, int] = {}   # mtime_ns der Datei nach unserem letzten Schreiben
+    _last_flush: Dict[Path, float] = {}
+    _dirty: set = set()
+    _flush_timer: Optional[threading.Timer] = None
+    _meta_lock = threading.RLock()
+
     def __init__(self, base_output_dir: str = None):
         """
         Initialisiert den Session Manager.
@@ -45,6 +69,9 @@ class SessionManager:
             base_output_dir: Basis-Verzeichnis fuer alle Sessions.
                            Falls None oder relativ: Wird automatisch im Projekt-Root platziert.
         """
+        # Logger-Handler einrichten (nach dem ersten Aufruf nur ein Dict-Lookup)
+        setup_logger("session_manager")
+
         if base_output_dir is None:
             base_output_dir = "output"
 
@@ -58,6 +85,8 @@ class SessionManager:
 
         self.base_output_dir = base_path
         self.base_output_dir.mkdir(exist_ok=True, parents=True)
+        # Präfix zum Abschneiden relativer Pfade (statt Path.relative_to pro Datei)
+        self._base_str = str(self.base_output_dir) + os.sep
         logger.info(f"Session Manager initialisiert mit Basis-Verzeichnis: {self.base_output_dir.resolve()}")
 
     def create_session(self) -> Path:
@@ -69,12 +98,16 @@ class SessionManager:
         """
         # Generiere eindeutigen Session-Namen
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        session_id = secrets.token_hex(4)  # 8-stellige Hex-ID
+        session_id = os.urandom(4).hex()  # 8-stellige Hex-ID
         session_name = f"session_{timestamp}_{session_id}"
 
         # Erstelle Session-Ordner
         session_path = self.base_output_dir / session_name
-        session_path.mkdir(exist_ok=True)
+        # Name enthält 32 Bit Zufall - existiert praktisch nie, daher direkt os.mkdir
+        try:
+            os.mkdir(session_path)
+        except FileExistsError:
+            pass
 
         # Erstelle Metadata-Datei
         metadata = {
@@ -90,8 +123,8 @@ class SessionManager:
         }
 
         metadata_path = session_path / "metadata.json"
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        with open(metadata_path, 'wb') as f:
+            f.write(orjson.dumps(metadata))
 
         logger.info(f"Session erstellt: {session_name} in {session_path.resolve()}")
         return session_path
@@ -114,25 +147,102 @@ class SessionManager:
         """
         metadata_path = session_path / "metadata.json"
 
-        # Lade existierende Metadata
-        with open(metadata_path, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
-
-        # Aktualisiere Felder
-        if status:
-            metadata["status"] = status
-        if files:
-            metadata["files"] = files
-        if progress:
-            metadata["progress"] = progress
+        with self._meta_lock:
+            metadata = self._load_metadata(metadata_path)
+            status_changed = bool(status) and metadata.get("status") != status
+
+            # Aktualisiere Felder
+            if status:
+                metadata["status"] = status
+            if files:
+                metadata["files"] = files
+            if progress:
+                metadata["progress"] = progress
+
+            # Nur den Zeitstempel merken - ins ISO-Format erst beim Schreiben
+            metadata["updated_at_ts"] = time.time()
+            self._dirty.add(metadata_path)
+
+            # Status- und Datei-Änderungen sofort speichern, reinen Fortschritt gebündelt
+            since_flush = time.monotonic() - self._last_flush.get(metadata_path, 0.0)
+            if status_changed or files or since_flush >= METADATA_FLUSH_INTERVAL:
+                self._write_metadata(metadata_path)
+            else:
+                self._schedule_flush()
 
-        metadata["updated_at"] = datetime.now().isoformat()
+        logger.debug(f"Session Metadata aktualisiert: {session_path.name}")
 
-        # Speichere aktualisierte Metadata
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+    @classmethod
+    def _load_metadata(cls, metadata_path: Path) -> dict:
+        """
+        Gibt die Metadata aus dem Cache zurück.
 
-        logger.debug(f"Session Metadata aktualisiert: {session_path.name}")
+        Von der Platte gelesen wird nur, wenn noch nichts gecacht ist oder die Datei
+        seit unserem letzten Schreiben von außen geändert wurde.
+        """
+        cached = cls._meta_cache.get(metadata_path)
+        if cached is not None and (
+            metadata_path in cls._dirty
+            or os.stat(metadata_path).st_mtime_ns == cls._meta_mtime.get(metadata_path)
+        ):
+            return cached
+
+        with open(metadata_path, 'rb') as f:
+            metadata = orjson.loads(f.read())
+
+        cls._meta_cache[metadata_path] = metadata
+        cls._meta_mtime[metadata_path] = os.stat(metadata_path).st_mtime_ns
+        return metadata
+
+    @classmethod
+    def _write_metadata(cls, metadata_path: Path):
+        """Schreibt die gecachte Metadata atomar (Temp-Datei + os.replace)"""
+        metadata = cls._meta_cache[metadata_path]
+        updated_at_ts = metadata.pop("updated_at_ts", None)
+        if updated_at_ts is not None:
+            metadata["updated_at"] = datetime.fromtimestamp(updated_at_ts).isoformat()
+
+        # orjson schreibt direkt UTF-8-Bytes (ohne Einrückung)
+        data = orjson.dumps(metadata)
+
+        tmp_path = metadata_path.with_name(f".{metadata_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, metadata_path)
+
+        cls._meta_mtime[metadata_path] = os.stat(metadata_path).st_mtime_ns
+        cls._last_flush[metadata_path] = time.monotonic()
+        cls._dirty.discard(metadata_path)
+
+    @classmethod
+    def _schedule_flush(cls):
+        """Startet den Flush-Timer, falls nicht schon einer läuft"""
+        if cls._flush_timer is None:
+            cls._flush_timer = threading.Timer(METADATA_FLUSH_INTERVAL, cls._flush_pending)
+            cls._flush_timer.start()
+
+    @classmethod
+    def _flush_pending(cls):
+        """Schreibt alle noch nicht gespeicherten Metadata (läuft im Timer-Thread)"""
+        with cls._meta_lock:
+            cls._flush_timer = None
+            for metadata_path in list(cls._dirty):
+                try:
+                    cls._write_metadata(metadata_path)
+                except OSError as e:
+                    # z.B. Session-Ordner inzwischen gelöscht
+                    cls._dirty.discard(metadata_path)
+                    logger.warning(f"Metadata konnte nicht gespeichert werden ({metadata_path}): {e}")
+
+    @classmethod
+    def _reset_after_fork(cls):
+        """Im Kindprozess: Timer-Thread und Sperre des Elternprozesses gibt es dort nicht"""
+        cls._meta_lock = threading.RLock()
+        cls._flush_timer = None
+        cls._meta_cache.clear()
+        cls._meta_mtime.clear()
+        cls._last_flush.clear()
+        cls._dirty.clear()
 
     def get_session_files(self, session_path: Path) -> List[Dict[str, any]]:
         """
@@ -145,24 +255,36 @@ class SessionManager:
             Liste mit Datei-Informationen
         """
         files = []
-
-        # Finde alle DOCX-Dateien
-        for file_path in session_path.glob("*.docx"):
-            files.append({
-                "name": file_path.name,
-                "path": str(file_path.relative_to(self.base_output_dir)),
-                "size": file_path.stat().st_size,
-                "created_at": datetime.fromtimestamp(file_path.stat().st_ctime).isoformat()
-            })
-
-        # Finde JSON-Datei
-        for file_path in session_path.glob("spesen_data.json"):
-            files.append({
-                "name": file_path.name,
-                "path": str(file_path.relative_to(self.base_output_dir)),
-                "size": file_path.stat().st_size,
-                "created_at": datetime.fromtimestamp(file_path.stat().st_ctime).isoformat()
-            })
+        json_files = []
+
+        # Relativer Pfad des Session-Ordners einmal bestimmen - Sessions liegen direkt im Basis-Verzeichnis
+        session_str = str(session_path)
+        if session_str.startswith(self._base_str):
+            rel_prefix = session_str[len(self._base_str):] + os.sep
+        else:
+            rel_prefix = str(session_path.relative_to(self.base_output_dir)) + os.sep
+
+        # Ein Verzeichnis-Durchlauf fuer DOCX- und JSON-Datei, ein stat() pro Datei
+        with os.scandir(session_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == "spesen_data.json":
+                    target = json_files
+                elif name.endswith(".docx"):
+                    target = files
+                else:
+                    continue
+
+                st = entry.stat()
+                target.append({
+                    "name": name,
+                    "path": rel_prefix + name,
+                    "size": st.st_size,
+                    "created_at": datetime.fromtimestamp(st.st_ctime).isoformat()
+                })
+
+        # JSON-Datei wie bisher nach den DOCX-Dateien
+        files.extend(json_files)
 
         return files
 
@@ -179,4 +301,9 @@ class SessionManager:
         session_path = self.base_output_dir / session_id
         if session_path.exists() and session_path.is_dir():
             return session_path
-        return None
\ No newline at end of file
+        return None
+
+
+# Ausstehende Metadata schreibt der Elternprozess selbst - das Kind beginnt leer
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=SessionManager._reset_after_fork)
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# Module liegen unter src/ und werden absolut importiert (z.B. "from utils.logger import ...")
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
@@ -0,0 +1,56 @@
+import multiprocessing
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from conftest import SRC_DIR
+
+WORKER_SCRIPT = textwrap.dedent("""
+    import multiprocessing
+    import sys
+
+    sys.path.insert(0, {src!r})
+    from utils.logger import setup_logger
+
+    # Wie in main_api: Logger schon im Elternprozess eingerichtet
+    setup_logger("main")
+
+
+    def work():
+        logger = setup_logger("main")
+        for i in range(3):
+            logger.info(f"worker info {{i}}")
+        setup_logger("generation_process").error("worker fehler")
+
+
+    if __name__ == "__main__":
+        multiprocessing.set_start_method({method!r})
+        setup_logger("api").info("parent")
+        process = multiprocessing.Process(target=work)
+        process.start()
+        process.join()
+        setup_logger("api").info("parent done")
+""")
+
+
+@pytest.mark.parametrize("method", multiprocessing.get_all_start_methods())
+def test_worker_log_lines_reach_stdout(tmp_path, method):
+    script = tmp_path / "worker.py"
+    script.write_text(WORKER_SCRIPT.format(src=str(SRC_DIR), method=method), encoding="utf-8")
+
+    result = subprocess.run(
+        [sys.executable, str(script)], capture_output=True, text=True, timeout=60
+    )
+
+    assert result.returncode == 0, result.stderr
+    for line in [
+        "INFO - parent",
+        "INFO - worker info 0",
+        "INFO - worker info 1",
+        "INFO - worker info 2",
+        "ERROR - worker fehler",
+        "INFO - parent done",
+    ]:
+        assert line in result.stdout
@@ -0,0 +1,58 @@
+import re
+
+import pytest
+
+from utils.match_utils import extract_iso_date_from_anpfiff, parse_anpfiff, parse_anpfiff_full
+
+
+def _old_parse_anpfiff(anpfiff_str):
+    """Split-Parser vor der Regex-Umstellung (Referenz)"""
+    try:
+        parts = anpfiff_str.split('·')
+        if len(parts) >= 3:
+            return parts[1].strip(), parts[2].replace('Uhr', '').strip()
+    except (AttributeError, IndexError):
+        pass
+    return anpfiff_str, ''
+
+
+def _old_extract_iso(anpfiff):
+    """ISO-Datum vor der Regex-Umstellung (Referenz)"""
+    match = re.search(r'(\d{2})\.(\d{2})\.(\d{4})', anpfiff)
+    if match:
+        day, month, year = match.groups()
+        return f"{year}-{month}-{day}"
+    return "1900-01-01"
+
+
+ANPFIFF_CASES = [
+    'Samstag · 08.11.2025 · 13:00 Uhr',
+    'So · 01.02.2026 · 9:30 Uhr',
+    'Samstag · 08.11.2025 · 13:00Uhr',
+    'Samstag·08.11.2025·13:00',
+    'Samstag · 08.11.2025 · 13.00 Uhr',
+    'Samstag · 08.11.2025 · ',
+    'So. · 09.11.25 · 10:30 Uhr',
+    'Samstag · 08.11.2025 · 13:00 Uhr · verlegt',
+    ' · 08.11.2025 · 13:00 Uhr',
+    '08.11.2025',
+    'Samstag 08.11.2025 13:00 Uhr',
+    'foo',
+    '',
+]
+
+
+@pytest.mark.parametrize("anpfiff", ANPFIFF_CASES)
+def test_parse_anpfiff_matches_split_parser(anpfiff):
+    assert parse_anpfiff(anpfiff) == _old_parse_anpfiff(anpfiff)
+
+
+@pytest.mark.parametrize("anpfiff", [case for case in ANPFIFF_CASES if case])
+def test_extract_iso_date_unchanged(anpfiff):
+    assert extract_iso_date_from_anpfiff(anpfiff) == _old_extract_iso(anpfiff)
+
+
+def test_parse_anpfiff_full():
+    assert parse_anpfiff_full('Samstag · 08.11.2025 · 13:00 Uhr') == ('2025-11-08', '08.11.2025', '13:00')
+    assert parse_anpfiff_full('So. · 09.11.25 · 10:30 Uhr') == ('1900-01-01', '09.11.25', '10:30')
+    assert parse_anpfiff(None) == (None, '')